@@ -7,7 +7,9 @@ from typing_extensions import _AnnotatedAlias
 #** Variables **#
 __all__ = [
     'pack',
+    'pack_into',
     'unpack',
+    'Codec',
 
     'deanno',
     'Context',
@@ -17,6 +19,9 @@ __all__ = [
     'IPv6Field',
     'MACField',
     'DomainField',
+    'DomainError',
+    'DomainPointerError',
+    'DomainLengthError',
     'IPv4',
     'IPv6',
     'MACAddr',
@@ -26,13 +31,20 @@ __all__ = [
     'IntHint',
     'IntFmt',
     'IntField',
+    'FloatFmt',
+    'FloatField',
+    'VarIntField',
+    'BitFields',
+    'BitStruct',
     'HintedBytes',
     'StaticBytes',
     'GreedyBytes',
     'HintedList',
     'StaticList',
     'GreedyList',
+    'HintedStruct',
     'Const',
+    'Switch',
     'I8',
     'I16',
     'I32',
@@ -45,10 +57,25 @@ __all__ = [
     'U48',
     'U64',
     'U128',
+    'F16',
+    'F32',
+    'F64',
+    'VarInt',
+    'ZigZag',
 
     'field',
     'Struct',
     'StructField',
+    'pack_sequence',
+
+    'IncompleteError',
+    'StreamContext',
+    'StreamDecoder',
+    'StructReader',
+    'StructWriter',
+
+    'FieldStats',
+    'Profiler',
 ]
 
 T = TypeVar('T')
@@ -65,44 +92,41 @@ def pack(fields: Sequence[Any],
     :param ctx:    serialization tracker for packaging multiple objects
     :return:       packed bytes
     """
-    if len(values) != len(fields):
-        raise OverflowError(f'{len(fields)} fields vs {len(values)} values.')
-    ctx     = ctx or Context()
-    content = bytearray()
-    for n, (field, value) in enumerate(zip(fields, values), 0):
-        wrapper, packer = deanno(field, f'field({n}) ')
-        try:
-            value    = wrapper(value)
-            content += packer._pack(value, ctx)
-        except (ValueError, OverflowError) as e:
-            name = packer.__class__.__name__
-            raise e.__class__(f'field({n})->{name}->{e}') from None
-    return bytes(content)
+    return get_codec(fields).pack(*values, ctx=ctx)
+
+def pack_into(fields: Sequence[Any], buffer: 'Buffer',
+    offset: int, *values: Any, ctx: Optional['Context'] = None) -> int:
+    """
+    pack struct fields directly into a preallocated writable buffer
+
+    :param fields: list of fields used to serialize values
+    :param buffer: bytearray, memoryview, mmap, etc. to write into
+    :param offset: offset within buffer to start writing
+    :param values: list of values to match encoding fields
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       number of bytes written
+    """
+    return get_codec(fields).pack_into(buffer, offset, *values, ctx=ctx)
 
 def unpack(fields: Sequence[Union['Field[T]', _AnnotatedAlias]],
-    raw: bytes, ctx: Optional['Context'] = None) -> Tuple[T]:
+    raw: 'Buffer', ctx: Optional['Context'] = None,
+    zero_copy: bool = False) -> Tuple[T]:
     """
     unpack struct fields from encoded bytes
 
-    :param fields: list of fields used to deserialize raw bytes
-    :param raw:    raw encoded bytes to unpack
-    :return:       unpacked struct field values
+    :param fields:    list of fields used to deserialize raw bytes
+    :param raw:       raw encoded bytes (or any buffer object) to unpack
+    :param ctx:       deserialization tracker for packaging multiple objects
+    :param zero_copy: return memoryview slices rather than copied bytes
+    :return:          unpacked struct field values
     """
-    ctx     = ctx or Context()
-    content = []
-    for n, field in enumerate(fields, 0):
-        wrapper, unpacker = deanno(field, f'field({n}) ')
-        try:
-            value = unpacker._unpack(raw, ctx)
-            value = wrapper(value)
-            content.append(value)
-        except (ValueError, OverflowError) as e:
-            name = unpacker.__class__.__name__
-            raise e.__class__(f'field({n})->{name}->{e}') from None
-    return tuple(content)
+    return get_codec(fields).unpack(raw, ctx, zero_copy) #type: ignore
 
 #** Imports **#
 from .abc import *
+from .codec import Codec, get_codec
 from .net import *
+from .profiler import *
 from .std import *
+from .stream import *
 from .struct import *
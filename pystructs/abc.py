@@ -1,22 +1,75 @@
 """
 Dataclass Struct Definition Components and Utilities
 """
+import struct
 from abc import abstractmethod
-from typing import Any, Callable, Dict, Protocol, Tuple, TypeVar
+from mmap import mmap
+from typing import (
+    Any, Callable, Dict, List, Optional,
+    Protocol, Sequence, Tuple, TypeVar, Union)
 from typing_extensions import (
     Annotated, _AnnotatedAlias, get_args, get_origin, runtime_checkable)
 
-from pyderive import dataclass, field
+from pyderive import dataclass
 
 #** Variable **#
-__all__ = ['Context', 'Field', 'deanno']
+__all__ = [
+    'IDENTITY',
+    'Buffer',
+    'Bytes',
+    'IncompleteError',
+    'DomainError',
+    'DomainPointerError',
+    'DomainLengthError',
+    'Context',
+    'StreamContext',
+    'Field',
+    'FixedFmt',
+    'deanno',
+    'writable',
+    'write_into',
+    'pack_field_into',
+    'field_size',
+    'field_packed_size',
+    'skip_field',
+]
 
 T = TypeVar('T')
 
 Wrapper = Callable[[Any], Any]
 
+#: sized and indexable byte buffers accepted when unpacking
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+#: decoded byte slice (a memoryview when decoding with zero-copy)
+Bytes = Union[bytes, memoryview]
+
+B = TypeVar('B', bound=Bytes)
+
+#: encoded domain suffix to offset of its first label
+DomainSuffixes = Dict[bytes, int]
+
+#: offset of domain label to (label, offset of next label or None)
+DomainLabels = Dict[int, Tuple[bytes, Optional[int]]]
+
+#: largest message offset addressable by a 14-bit domain pointer
+DOMAIN_PTR_MAX = 0x3FFF
+
+#: codec of a 2-byte domain pointer (including the pointer flag bits)
+DOMAIN_POINTER = struct.Struct('>H')
+
+#: maximum encoded length of a domain label
+DOMAIN_MAX_LABEL = 63
+
+#: maximum encoded length of a domain name (including length bytes)
+DOMAIN_MAX_NAME = 255
+
 #** Functions **#
 
+def IDENTITY(value: Any) -> Any:
+    """default no-op field value wrapper"""
+    return value
+
 def deanno(anno: Any, prefix: str = '') -> Tuple[Wrapper, 'Field']:
     """
     retrieve field definition from annotated type (if required)
@@ -26,15 +79,16 @@ def deanno(anno: Any, prefix: str = '') -> Tuple[Wrapper, 'Field']:
     :return:       (field value wrapper, field object definition)
     """
     annos = [anno]
-    wrap  = lambda x: x
+    wrap  = IDENTITY
     while annos:
         sub_anno = annos.pop(0)
-        if isinstance(sub_anno, Field):
+        origin   = get_origin(sub_anno)
+        # annotated struct types forward attribute access to the struct
+        if origin is not Annotated and isinstance(sub_anno, Field):
             return (wrap, sub_anno)
-        origin = get_origin(sub_anno)
         if origin is Annotated:
             args   = get_args(sub_anno)
-            fields = [f for f in args if isinstance(f, Field)]
+            fields = [f for f in (*args[1:], args[0]) if isinstance(f, Field)]
             #NOTE: a field annotations first argument may be used to wrap
             # input/output to the relevant type (if supported).
             # this is useful for working with things like ENUMS
@@ -42,45 +96,221 @@ def deanno(anno: Any, prefix: str = '') -> Tuple[Wrapper, 'Field']:
             farg = args[0]
             if sub_anno is anno \
                 and get_origin(args[0]) is None \
-                and callable(farg):
+                and callable(farg) \
+                and not isinstance(farg, Field):
                 wrap = farg
             if fields:
                 return (wrap, fields[0])
             annos.extend([f for f in args if isinstance(f, _AnnotatedAlias)])
     raise TypeError(f'{prefix}invalid field annotation: {anno!r}')
 
+def writable(buffer: Buffer) -> memoryview:
+    """
+    retrieve flat writable byte memoryview of the given buffer object
+
+    :param buffer: bytearray, memoryview, mmap, etc.
+    :return:       writable byte memoryview of buffer
+    """
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    if view.readonly:
+        raise TypeError(f'cannot pack into readonly {type(buffer).__name__}')
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+def write_into(buffer: memoryview, offset: int, data: Bytes) -> int:
+    """
+    write data into buffer at the specified offset with bounds checking
+
+    :param buffer: writable buffer to write into
+    :param offset: offset within buffer to write data
+    :param data:   data to write into buffer
+    :return:       number of bytes written
+    """
+    end = offset + len(data)
+    if end > len(buffer):
+        raise OverflowError(
+            f'buffer too small to write {len(data)} bytes at offset {offset}')
+    buffer[offset:end] = data
+    return len(data)
+
+def pack_field_into(field: 'Field[T]',
+    value: T, buffer: memoryview, offset: int, ctx: 'Context') -> int:
+    """
+    pack field value directly into buffer using `_pack_into` when supported
+
+    :param field:  field definition used to serialize value
+    :param value:  value to serialize into buffer
+    :param buffer: writable buffer to write into
+    :param offset: offset within buffer to write data
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       number of bytes written
+    """
+    pack_into = getattr(field, '_pack_into', None)
+    if pack_into is not None:
+        return pack_into(value, buffer, offset, ctx)
+    return write_into(buffer, offset, field._pack(value, ctx))
+
+def field_size(field: 'Field') -> Optional[int]:
+    """
+    retrieve static encoded size of field (if fixed-width)
+
+    :param field: field definition to retrieve size of
+    :return:      static size in bytes or none if variable-width
+    """
+    size = getattr(field, '_size', None)
+    return size() if size is not None else None
+
+def field_packed_size(field: 'Field[T]', value: T, ctx: 'Context') -> int:
+    """
+    calculate encoded size of field value without serializing it
+
+    the context index is advanced as if the value were packed. fields
+    without size support fall back to packing the value.
+
+    :param field: field definition used to serialize value
+    :param value: value to calculate the encoded size of
+    :param ctx:   serialization tracker for packaging multiple objects
+    :return:      encoded size in bytes
+    """
+    packed_size = getattr(field, '_packed_size', None)
+    if packed_size is not None:
+        return packed_size(value, ctx)
+    size = field_size(field)
+    if size is None:
+        return len(field._pack(value, ctx))
+    ctx.index += size
+    return size
+
+def skip_field(field: 'Field', raw: Buffer, ctx: 'Context'):
+    """
+    advance context index past an encoded field value without decoding it
+
+    fixed-width fields are skipped by size while fields implementing
+    `_skip(raw, ctx)` skip using their own size hints. all other fields
+    fall back to unpacking the value.
+
+    :param field: field definition used to deserialize raw bytes
+    :param raw:   raw encoded bytes being unpacked
+    :param ctx:   deserialization tracker for packaging multiple objects
+    """
+    skip = getattr(field, '_skip', None)
+    if skip is not None:
+        return skip(raw, ctx)
+    size = field_size(field)
+    if size is None:
+        field._unpack(raw, ctx)
+        return
+    ctx.require(raw, size)
+    ctx.index += size
+
 #** Classes **#
 
+class IncompleteError(ValueError):
+    """
+    Raised when a decode runs out of bytes before the message is complete
+    """
+    pass
+
+class DomainError(ValueError):
+    """
+    Raised when an encoded DNS domain name is malformed
+    """
+    pass
+
+class DomainPointerError(DomainError):
+    """
+    Raised when a DNS domain pointer is invalid, out of bounds or loops
+    """
+    pass
+
+class DomainLengthError(DomainError):
+    """
+    Raised when a DNS domain label or name exceeds its length limit
+    """
+    pass
+
 @dataclass(slots=True)
 class Context:
     """
     Encoding/Decoding Context Tracking
     """
-    index: int = 0
-    index_to_domain: Dict[int, bytes] = field(default_factory=dict)
-    domain_to_index: Dict[bytes, int] = field(default_factory=dict)
+    index:           int          = 0
+    domain_suffixes: Optional[DomainSuffixes] = None
+    domain_labels:   Optional[DomainLabels]   = None
+    zero_copy:       bool         = False
 
     def reset(self):
         """
         reset variables in context to their default state
         """
         self.index = 0
-        self.index_to_domain.clear()
-        self.domain_to_index.clear()
+        if self.domain_suffixes:
+            self.domain_suffixes.clear()
+        if self.domain_labels:
+            self.domain_labels.clear()
 
-    def slice(self, raw: bytes, length: int) -> bytes:
+    @property
+    def index_to_domain(self) -> Dict[int, bytes]:
+        """
+        materialize mapping of decoded domain offsets to full domain names
+        """
+        table = self.domain_labels or {}
+        return {index: self.domain_at(index) for index in table}
+
+    @property
+    def domain_to_index(self) -> Dict[bytes, int]:
+        """
+        copy mapping of encoded domain names to pointer offsets
+        """
+        return dict(self.domain_suffixes or {})
+
+    def buffer(self, raw: Buffer) -> Bytes:
+        """
+        normalize buffer-protocol object for slicing without extra copies
+
+        :param raw: raw bytes, bytearray, memoryview, mmap, etc.
+        :return:    bytes or flat byte memoryview of the raw buffer
+        """
+        if isinstance(raw, bytes) and not self.zero_copy:
+            return raw
+        view = raw if isinstance(raw, memoryview) else memoryview(raw)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        return view
+
+    def require(self, raw: Buffer, length: int):
+        """
+        ensure n-length bytes remain in raw bytes from current context index
+
+        :param raw:    raw bytes being unpacked
+        :param length: number of bytes required
+        """
+        if self.index + length > len(raw):
+            raise ValueError(f'too little data to unpack bytes({length})')
+
+    def slice(self, raw: Buffer, length: int) -> Bytes:
         """
         parse slice of n-length starting from current context index
 
+        returns a memoryview into the raw buffer rather than a copy
+        when `zero_copy` is enabled.
+
         :param raw:    raw bytes to slice from
         :param length: length of slice to retrieve
         :return:       slice from raw bytes
         """
-        data = raw[self.index:self.index + length]
+        data: Bytes
+        if self.zero_copy:
+            view = raw if isinstance(raw, memoryview) else memoryview(raw)
+            data = view[self.index:self.index + length]
+        else:
+            chunk = raw[self.index:self.index + length]
+            data  = chunk if isinstance(chunk, bytes) else bytes(chunk)
         self.index += len(data)
         return data
 
-    def track_bytes(self, data: bytes) -> bytes:
+    def track_bytes(self, data: B) -> B:
         """
         track additional length of bytes within context
 
@@ -89,6 +319,108 @@ class Context:
         self.index += len(data)
         return data
 
+    def compress_domain(self, domain: bytes) -> bytes:
+        """
+        encode domain labels up until the longest previously encoded suffix
+        and save the remaining suffixes at their encoded offsets
+
+        only suffixes beginning within the 14-bit pointer range are saved.
+        the context index is advanced past the encoded domain.
+
+        :param domain: domain being encoded (optional trailing root dot)
+        :return:       encoded labels ending in terminator or pointer
+        """
+        domain = domain[:-1] if domain.endswith(b'.') else domain
+        if len(domain) + 2 > DOMAIN_MAX_NAME:
+            raise DomainLengthError(f'domain exceeds {DOMAIN_MAX_NAME}')
+        table = self.domain_suffixes
+        if table is None:
+            table = self.domain_suffixes = {}
+        encoded = bytearray()
+        offset  = self.index
+        value   = domain
+        dot     = b''
+        while value:
+            pointer = table.get(value)
+            if pointer is not None:
+                encoded += DOMAIN_POINTER.pack(pointer | 0xC000)
+                offset  += 2
+                break
+            if offset <= DOMAIN_PTR_MAX:
+                table[value] = offset
+            suffix            = value
+            label, dot, value = value.partition(b'.')
+            if not 0 < len(label) <= DOMAIN_MAX_LABEL:
+                self._discard_suffixes(domain, len(domain) - len(suffix) + 1)
+                raise DomainLengthError(f'invalid domain labels: {domain!r}')
+            encoded.append(len(label))
+            encoded += label
+            offset  += 1 + len(label)
+        else:
+            if dot:
+                self._discard_suffixes(domain, len(domain))
+                raise DomainLengthError(f'invalid domain labels: {domain!r}')
+            encoded.append(0)
+            offset += 1
+        self.index = offset
+        return bytes(encoded)
+
+    def _discard_suffixes(self, domain: bytes, stop: int):
+        """discard suffixes saved for a domain that failed to encode"""
+        table = self.domain_suffixes or {}
+        start = 0
+        while start < stop:
+            table.pop(domain[start:], None)
+            start = domain.find(b'.', start) + 1 or stop
+
+    def save_labels(self,
+        labels: Sequence[Tuple[int, bytes]], pointer: Optional[int] = None):
+        """
+        save decoded domain labels by offset for later pointer resolution
+
+        :param labels:  (offset, label) pairs of the decoded domain
+        :param pointer: offset the final label points to (if any)
+        """
+        if not labels:
+            return
+        table = self.domain_labels
+        if table is None:
+            table = self.domain_labels = {}
+        for n, (offset, label) in enumerate(labels, 1):
+            follow        = labels[n][0] if n < len(labels) else pointer
+            table[offset] = (label, follow)
+
+    def resolve_labels(self, index: int) -> List[bytes]:
+        """
+        resolve labels of previously decoded domain starting at offset
+
+        :param index: offset of first domain label
+        :return:      labels of the domain
+        """
+        labels: List[bytes]   = []
+        offset: Optional[int] = index
+        table = self.domain_labels or {}
+        size  = 1
+        while offset is not None:
+            entry = table.get(offset)
+            if entry is None:
+                raise DomainPointerError(f'invalid domain pointer: {offset}')
+            label, offset = entry
+            size += 1 + len(label)
+            if size > DOMAIN_MAX_NAME:
+                raise DomainLengthError(f'domain exceeds {DOMAIN_MAX_NAME}')
+            labels.append(label)
+        return labels
+
+    def domain_at(self, index: int) -> bytes:
+        """
+        materialize previously decoded domain name starting at offset
+
+        :param index: offset of first domain label
+        :return:      full domain name
+        """
+        return b'.'.join(self.resolve_labels(index))
+
     def save_domain(self, domain: bytes, index: int):
         """
         save domain to context-manager for domain PTR assignments
@@ -96,13 +428,77 @@ class Context:
         :param domain: domain to save in context
         :param index:  index of the domain being saved
         """
-        self.index_to_domain[index] = domain
-        self.domain_to_index[domain] = index
+        saved, self.index = self.index, index
+        try:
+            self.compress_domain(domain)
+        finally:
+            self.index = saved
+        domain  = domain[:-1] if domain.endswith(b'.') else domain
+        labels  = domain.split(b'.') if domain else []
+        offsets = [index]
+        for label in labels[:-1]:
+            offsets.append(offsets[-1] + 1 + len(label))
+        self.save_labels(list(zip(offsets, labels)))
+
+@dataclass(slots=True)
+class StreamContext(Context):
+    """
+    Decoding Context that Reports Short Reads as Incomplete Rather than Invalid
+    """
+    needed: int = 0
+
+    def reset(self):
+        Context.reset(self)
+        self.needed = 0
+
+    def require(self, raw: Buffer, length: int):
+        """
+        ensure n-length bytes remain in raw bytes from current context index
+
+        records the total number of bytes required before raising so the
+        reader knows exactly how much more data to wait for.
+
+        :param raw:    raw bytes being unpacked
+        :param length: number of bytes required
+        """
+        needed = self.index + length
+        if needed > len(raw):
+            self.needed = max(self.needed, needed)
+            raise IncompleteError(f'need {needed - len(raw)} more bytes')
+
+    def slice(self, raw: Buffer, length: int) -> Bytes:
+        self.require(raw, length)
+        return Context.slice(self, raw, length)
+
+@dataclass(slots=True)
+class FixedFmt:
+    """
+    Fixed-Width Field Description used to Merge Fields into `struct.Struct`
+
+    fields may optionally implement `_fmt()` to return this description,
+    allowing runs of fixed-width fields to be packed/unpacked in a single call.
+    `encode`/`decode` convert values to/from the `struct` representation
+    and must raise on any value the field's own `_pack`/`_unpack` rejects.
+    `slices` marks fields returning slices of the input in zero-copy mode.
+    """
+    fmt:    str
+    size:   int
+    order:  Optional[str]     = None
+    native: Optional[type]    = None
+    encode: Optional[Wrapper] = None
+    decode: Optional[Wrapper] = None
+    slices: bool              = False
 
 @runtime_checkable
 class Field(Protocol[T]):
     """
     Abstract Serialization Object Definition
+
+    fields may optionally implement `_pack_into(value, buffer, offset, ctx)`
+    to write directly into a buffer and return the number of bytes written,
+    `_size()` to report a static encoded size, `_packed_size(value, ctx)`
+    to calculate the encoded size of a value without serializing it and
+    `_skip(raw, ctx)` to advance past an encoded value without decoding it.
     """
 
     @abstractmethod
@@ -110,5 +506,5 @@ class Field(Protocol[T]):
         raise NotImplementedError
 
     @abstractmethod
-    def _unpack(self, raw: bytes, ctx: Context) -> T:
+    def _unpack(self, raw: Buffer, ctx: Context) -> T:
         raise NotImplementedError
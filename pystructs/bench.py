@@ -0,0 +1,286 @@
+"""
+PyStructs Serialization Benchmark Suite
+
+run with `python -m pystructs.bench` to measure pack/unpack throughput of
+every field type and a range of struct shapes. results are written as JSON
+and may be compared against a previous run to detect regressions.
+"""
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from ipaddress import IPv4Address, IPv6Address
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing_extensions import Annotated
+
+from pyderive import dataclass
+
+from . import *
+
+#** Variables **#
+__all__ = ['Case', 'cases', 'measure', 'run', 'compare', 'main']
+
+#: default minimum duration of a single timing run in seconds
+MIN_TIME = 0.2
+
+#: default number of timing runs to take the best result of
+REPEAT = 3
+
+#: default relative slowdown allowed before a case counts as regressed
+THRESHOLD = 0.10
+
+#** Classes **#
+
+@dataclass(slots=True)
+class Case:
+    """
+    Single Benchmark Case Packing and Unpacking a Value
+    """
+    name:   str
+    pack:   Callable[[], bytes]
+    unpack: Callable[[bytes], Any]
+
+class Flat(Struct):
+    a: U8
+    b: U16
+    c: U32
+    d: U64
+    e: Annotated[bytes, StaticBytes(8)]
+
+class FlatGen(Flat, codegen=True):
+    pass
+
+class Mixed(Struct):
+    kind:    U8
+    addr:    IPv4
+    mac:     MACAddr
+    name:    Domain
+    payload: Annotated[bytes, HintedBytes(U16)]
+
+class Leaf(Struct):
+    a: U16
+    b: Annotated[bytes, HintedBytes(U8)]
+
+class Branch(Struct):
+    left:  Leaf
+    right: Leaf
+
+class Tree(Struct):
+    left:  Branch
+    right: Branch
+    size:  U32
+
+class Deep(Struct):
+    left:  Tree
+    right: Tree
+
+class Records(Struct):
+    items: Annotated[List[Leaf], HintedList(U16, Leaf)]
+
+class Ints(Struct):
+    items: Annotated[List[int], HintedList(U32, U32)]
+
+class Names(Struct):
+    names: Annotated[List[bytes], HintedList(U16, Domain)]
+
+#** Functions **#
+
+def field_case(name: str, field: Any, value: Any) -> Case:
+    """
+    build benchmark case for a single field definition
+
+    :param name:  name of benchmark case
+    :param field: field definition (or annotation) to benchmark
+    :param value: value to pack/unpack
+    :return:      benchmark case
+    """
+    wrap, field = deanno(field)
+    value       = wrap(value)
+    pack        = field._pack
+    unpack      = field._unpack
+    return Case(name,
+        lambda: pack(value, Context()), lambda raw: unpack(raw, Context()))
+
+def struct_case(name: str, value: Struct) -> Case:
+    """
+    build benchmark case for a struct instance
+
+    :param name:  name of benchmark case
+    :param value: struct instance to pack/unpack
+    :return:      benchmark case
+    """
+    return Case(name, value.pack, value.unpack)
+
+def cases() -> List[Case]:
+    """
+    build all benchmark cases
+
+    :return: list of benchmark cases
+    """
+    leaf   = Leaf(1, b'leaf')
+    tree   = Tree(Branch(leaf, leaf), Branch(leaf, leaf), 7)
+    names  = [b'host%d.zone%d.example.com' % (n, n % 8) for n in range(128)]
+    return [
+        field_case('field.U8', U8, 255),
+        field_case('field.U16', U16, 65535),
+        field_case('field.U32', U32, 2 ** 32 - 1),
+        field_case('field.U64', U64, 2 ** 64 - 1),
+        field_case('field.U128', U128, 2 ** 128 - 1),
+        field_case('field.I32', I32, -2 ** 31),
+        field_case('field.I48', I48, -2 ** 47),
+        field_case('field.F16', F16, 1.5),
+        field_case('field.F32', F32, 1.5),
+        field_case('field.F64', F64, 1.5),
+        field_case('field.VarInt', VarInt, 2 ** 63),
+        field_case('field.ZigZag', ZigZag, -2 ** 62),
+        field_case('field.HintedBytes', HintedBytes(U16), b'x' * 64),
+        field_case('field.StaticBytes', StaticBytes(64), b'x' * 64),
+        field_case('field.GreedyBytes', GreedyBytes(), b'x' * 64),
+        field_case('field.HintedList', HintedList(U8, U16), list(range(64))),
+        field_case('field.StaticList', StaticList(64, U16), list(range(64))),
+        field_case('field.GreedyList', GreedyList(U16), list(range(64))),
+        field_case('field.VarIntList',
+            HintedList(VarInt, VarInt), list(range(0, 64 << 8, 256))),
+        field_case('field.Const', Const(b'MAGIC'), b'MAGIC'),
+        field_case('field.BitStruct', BitStruct(U16,
+            qr=1, opcode=4, aa=1, tc=1, rd=1, ra=1, z=3, rcode=4),
+            BitFields(qr=1, rd=1, rcode=3)),
+        field_case('field.Switch',
+            Switch(U8, {1: Leaf, 2: Flat}), Leaf(1, b'leaf')),
+        field_case('field.HintedStruct',
+            HintedStruct(U16, Leaf), Leaf(1, b'leaf')),
+        field_case('field.IPv4', IPv4, IPv4Address('10.0.0.1')),
+        field_case('field.IPv6', IPv6, IPv6Address('fe80::1')),
+        field_case('field.MACAddr', MACAddr, '00:11:22:33:44:55'),
+        field_case('field.Domain', Domain, b'www.example.com'),
+        struct_case('struct.flat', Flat(1, 2, 3, 4, b'12345678')),
+        struct_case('struct.flat_codegen', FlatGen(1, 2, 3, 4, b'12345678')),
+        struct_case('struct.mixed', Mixed(
+            1, IPv4Address('10.0.0.1'), '00:11:22:33:44:55',
+            b'www.example.com', b'x' * 32)),
+        struct_case('struct.nested', Deep(tree, tree)),
+        struct_case('struct.records_1k', Records([leaf] * 1000)),
+        struct_case('list.u32_10k', Ints(list(range(10000)))),
+        struct_case('dns.compressed_128', Names(names)),
+    ]
+
+def measure(func: Callable[[], Any],
+    min_time: float = MIN_TIME, repeat: int = REPEAT) -> float:
+    """
+    measure best operations per second of the given function
+
+    :param func:     function to benchmark
+    :param min_time: minimum duration of a single timing run in seconds
+    :param repeat:   number of timing runs to take the best result of
+    :return:         operations per second
+    """
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+    return number / best
+
+def run(match: Optional[str] = None,
+    min_time: float = MIN_TIME, repeat: int = REPEAT) -> Dict[str, Any]:
+    """
+    run benchmark cases and collect results
+
+    :param match:    only run cases whose name contains this substring
+    :param min_time: minimum duration of a single timing run in seconds
+    :param repeat:   number of timing runs to take the best result of
+    :return:         json serializable benchmark report
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for case in cases():
+        if match and match not in case.name:
+            continue
+        raw    = case.pack()
+        pack   = measure(case.pack, min_time, repeat)
+        unpack = measure(lambda: case.unpack(raw), min_time, repeat)
+        results[case.name] = {
+            'size':         len(raw),
+            'pack_ops':     round(pack, 1),
+            'pack_bytes':   round(pack * len(raw), 1),
+            'unpack_ops':   round(unpack, 1),
+            'unpack_bytes': round(unpack * len(raw), 1),
+        }
+    return {
+        'python':         platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform':       platform.platform(),
+        'results':        results,
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+    threshold: float = THRESHOLD) -> List[str]:
+    """
+    compare benchmark reports and list regressed cases
+
+    :param baseline:  previous benchmark report
+    :param current:   new benchmark report
+    :param threshold: relative slowdown allowed before counting as regressed
+    :return:          descriptions of regressed cases
+    """
+    regressions: List[str] = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        for key in ('pack_ops', 'unpack_ops'):
+            ratio = result[key] / before[key]
+            if ratio < 1 - threshold:
+                regressions.append(f'{name} {key} {ratio:.2f}x')
+    return regressions
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    benchmark command line entrypoint
+
+    :param argv: command line arguments
+    :return:     exit code (non-zero when regressions are found)
+    """
+    parser = ArgumentParser(prog='python -m pystructs.bench',
+        description='measure pystructs pack/unpack throughput')
+    parser.add_argument('-k', '--match',
+        help='only run cases whose name contains this substring')
+    parser.add_argument('-o', '--output',
+        help='write json report to file rather than stdout')
+    parser.add_argument('-c', '--compare',
+        help='json report of a previous run to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=THRESHOLD,
+        help='relative slowdown allowed when comparing (default: 0.10)')
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+        help='minimum duration of a single timing run in seconds')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+        help='number of timing runs to take the best result of')
+    args   = parser.parse_args(argv)
+    report = run(args.match, args.min_time, args.repeat)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if not args.compare:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, report, args.threshold)
+    for regression in regressions:
+        print(f'regression: {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,693 @@
+"""
+Precompiled Field Serialization Steps
+"""
+import struct
+from array import array
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .abc import IDENTITY, Buffer, Context, Field, FixedFmt, Wrapper
+from .abc import deanno, field_packed_size, field_size, pack_field_into
+from .abc import skip_field
+from .abc import writable
+from .std import ARRAY_CODES, Container
+
+#** Variables **#
+__all__ = [
+    'as_bytes',
+    'fixed_fmt',
+    'compile_steps',
+    'pack_steps',
+    'pack_steps_into',
+    'packed_size_steps',
+    'unpack_steps',
+    'skip_steps',
+    'field_steps',
+    'codegen_pack',
+    'codegen_unpack',
+    'get_codec',
+
+    'Codec',
+    'Step',
+    'FieldStep',
+    'FixedRun',
+]
+
+#: compiled serialization step
+Step = Union['FieldStep', 'FixedRun']
+
+#: (error label, value wrapper, field definition) used to compile steps
+StepItem = Tuple[str, Wrapper, Field]
+
+#: maximum number of compiled codecs cached for the functional api
+CACHE_SIZE = 256
+
+#: lru cache of compiled codecs keyed by the identity and state of their fields
+CACHE: 'OrderedDict[Tuple[Tuple[int, str], ...], Codec]' = OrderedDict()
+CACHE_LOCK = Lock()
+
+#** Functions **#
+
+def _chain(first: Wrapper, second: Wrapper) -> Wrapper:
+    """chain two value wrappers into a single callable"""
+    return lambda value: second(first(value))
+
+def as_bytes(value: Any) -> Any:
+    """bytes value wrapper preserving zero-copy memoryview slices"""
+    return value if isinstance(value, (bytes, memoryview)) else bytes(value)
+
+def fixed_fmt(field: Any) -> Optional[FixedFmt]:
+    """
+    retrieve fixed-width `struct` description of field (if supported)
+
+    :param field: field definition to retrieve description for
+    :return:      fixed-width description (if supported)
+    """
+    func = getattr(field, '_fmt', None)
+    return func() if callable(func) else None
+
+def compile_steps(items: Sequence[StepItem]) -> List[Step]:
+    """
+    compile fields into serialization steps merging runs of fixed-width
+    fields into single precompiled `struct.Struct` codecs
+
+    :param items: sequence of (label, wrapper, field) to compile
+    :return:      list of compiled serialization steps
+    """
+    steps: List[Step] = []
+    run:   List[Tuple[FieldStep, FixedFmt]] = []
+    order: Optional[str] = None
+    for index, (label, wrap, field) in enumerate(items, 0):
+        step = FieldStep(index, label, wrap, field)
+        fmt  = fixed_fmt(field)
+        # finish existing run when field is not mergable
+        if fmt is None or (order and fmt.order and fmt.order != order):
+            if run:
+                steps.append(FixedRun(run, order))
+            run, order = [], None
+        if fmt is None:
+            steps.append(step)
+            continue
+        run.append((step, fmt))
+        order = order or fmt.order
+    if run:
+        steps.append(FixedRun(run, order))
+    return steps
+
+def pack_steps(
+    steps: Sequence[Step], values: Sequence[Any], ctx: Context) -> bytes:
+    """
+    pack values using the compiled serialization steps
+
+    :param steps:  compiled serialization steps
+    :param values: values to pack in field order
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       packed bytes
+    """
+    raw = bytearray()
+    for step in steps:
+        raw += step.pack(values, ctx)
+    return bytes(raw)
+
+def pack_steps_into(steps: Sequence[Step], values: Sequence[Any],
+    buffer: memoryview, offset: int, ctx: Context) -> int:
+    """
+    pack values directly into buffer using the compiled serialization steps
+
+    :param steps:  compiled serialization steps
+    :param values: values to pack in field order
+    :param buffer: writable buffer to write into
+    :param offset: offset within buffer to start writing
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       number of bytes written
+    """
+    start = offset
+    for step in steps:
+        offset += step.pack_into(values, buffer, offset, ctx)
+    return offset - start
+
+def packed_size_steps(
+    steps: Sequence[Step], values: Sequence[Any], ctx: Context) -> int:
+    """
+    calculate encoded size of values using the compiled serialization steps
+
+    :param steps:  compiled serialization steps
+    :param values: values to calculate size of in field order
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       encoded size in bytes
+    """
+    return sum(step.packed_size(values, ctx) for step in steps)
+
+def unpack_steps(steps: Sequence[Step], raw: Buffer, ctx: Context) -> list:
+    """
+    unpack values using the compiled serialization steps
+
+    :param steps: compiled serialization steps
+    :param raw:   raw encoded bytes to unpack
+    :param ctx:   deserialization tracker for packaging multiple objects
+    :return:      unpacked values in field order
+    """
+    values: List[Any] = []
+    for step in steps:
+        step.unpack(raw, ctx, values)
+    return values
+
+def skip_steps(steps: Sequence[Step], raw: Buffer, ctx: Context):
+    """
+    advance context index past values without decoding them
+
+    :param steps: compiled serialization steps
+    :param raw:   raw encoded bytes being unpacked
+    :param ctx:   deserialization tracker for packaging multiple objects
+    """
+    for step in steps:
+        step.skip(raw, ctx)
+
+def field_steps(steps: Sequence[Step]) -> List['FieldStep']:
+    """
+    expand compiled steps into individual field steps in field order
+
+    :param steps: compiled serialization steps
+    :return:      single field serialization steps
+    """
+    fields: List[FieldStep] = []
+    for step in steps:
+        if isinstance(step, FixedRun):
+            fields.extend(step.steps)
+        else:
+            fields.append(step)
+    return fields
+
+def _offset(offset: int) -> str:
+    """generate index expression for static offset from local index"""
+    return f'_i + {offset}' if offset else '_i'
+
+def _create_fn(name: str,
+    args: str, body: List[str], env: Dict[str, Any]) -> Callable:
+    """
+    compile generated function source binding the environment as closures
+
+    :param name: name of the generated function
+    :param args: function arguments definition
+    :param body: lines of code making up the function body
+    :param env:  objects to bind as local variables within the function
+    :return:     generated function
+    """
+    params = ', '.join(env)
+    lines  = '\n'.join(f'        {line}' for line in body)
+    source = f'def __create_fn__({params}):\n' \
+        f'    def {name}({args}):\n{lines}\n    return {name}'
+    namespace: Dict[str, Any] = {}
+    exec(source, {}, namespace)
+    return namespace['__create_fn__'](**env)
+
+def _trusted(body: List[str], args: str, env: Dict[str, Any],
+    checked: Callable) -> List[str]:
+    """
+    wrap generated body in a single handler re-running the checked path
+
+    errors are only annotated with the failing field label once they occur
+    by restoring the context index and re-running the checked function.
+    fixed-width runs keep their own side-effect free fallback so the
+    handler is only reached by errors raised from individual fields. the
+    original error is re-raised if the checked path unexpectedly passes.
+    """
+    env['_checked'] = checked
+    return [
+        '_s = ctx.index',
+        'try:',
+        *(f'    {line}' for line in body),
+        'except Exception:',
+        '    ctx.index = _s',
+        f'    _checked({args})',
+        '    raise',
+    ]
+
+def codegen_pack(steps: Sequence[Step],
+    names:   Sequence[str],
+    getter:  Callable[[Any], Sequence[Any]],
+    checked: Optional[Callable] = None,
+) -> Callable:
+    """
+    generate specialized struct pack function from compiled steps
+
+    :param steps:   compiled serialization steps
+    :param names:   attribute names of struct fields in field order
+    :param getter:  attribute getter used to retrieve values on slow-path
+    :param checked: skip per-field error handling and re-run this function
+        to annotate field errors when any are raised (trusted mode)
+    :return:        generated `_pack(cls, value, ctx)` function
+    """
+    env:   Dict[str, Any] = {'_getter': getter}
+    body:  List[str] = []
+    parts: List[str] = []
+    for k, step in enumerate(steps, 0):
+        parts.append(f'_p{k}')
+        if isinstance(step, FixedRun):
+            encode = dict(step.encode)
+            args   = []
+            for n, sub in enumerate(step.steps, 0):
+                arg = f'value.{names[sub.index]}'
+                if n in encode:
+                    env[f'_e{k}_{n}'] = encode[n]
+                    arg = f'_e{k}_{n}({arg})'
+                args.append(arg)
+            env[f'_r{k}'] = step.codec.pack
+            env[f'_R{k}'] = step
+            body.extend([
+                'try:',
+                f'    _p{k} = _r{k}({", ".join(args)})',
+                'except Exception:',
+                f'    _p{k} = _R{k}.pack(_getter(value), ctx)',
+                'else:',
+                f'    ctx.index += {step.size}',
+            ])
+            continue
+        arg = f'value.{names[step.index]}'
+        if step.wrap is not IDENTITY:
+            env[f'_w{k}'] = step.wrap
+            arg = f'_w{k}({arg})'
+        env[f'_f{k}'] = step.field._pack
+        if checked is not None:
+            body.append(f'_p{k} = _f{k}({arg}, ctx)')
+            continue
+        env[f'_l{k}'] = step.label
+        body.extend([
+            'try:',
+            f'    _p{k} = _f{k}({arg}, ctx)',
+            'except (ValueError, OverflowError) as e:',
+            f"    raise e.__class__(f'{{_l{k}}}->{{e}}') from None",
+        ])
+    body.append(f'return b"".join(({"".join(f"{p}, " for p in parts)}))')
+    if checked is not None:
+        body = _trusted(body, 'cls, value, ctx', env, checked)
+    return _create_fn('_pack', 'cls, value, ctx', body, env)
+
+def codegen_unpack(steps: Sequence[Step],
+    names:   Sequence[str],
+    kwargs:  bool               = False,
+    checked: Optional[Callable] = None,
+) -> Callable:
+    """
+    generate specialized struct unpack function from compiled steps
+
+    :param steps:   compiled serialization steps
+    :param names:   attribute names of struct fields in field order
+    :param kwargs:  construct struct using keyword arguments when enabled
+    :param checked: skip per-field error handling and re-run this function
+        to annotate field errors when any are raised (trusted mode)
+    :return:        generated `_unpack(cls, raw, ctx)` function
+    """
+    env:  Dict[str, Any] = {}
+    body: List[str] = []
+    # track static offset from local index `_i` while context lags behind
+    offset: Optional[int] = None
+    for k, step in enumerate(steps, 0):
+        if isinstance(step, FixedRun):
+            if offset is None:
+                body.append('_i = ctx.index')
+                offset = 0
+            index   = _offset(offset)
+            targets = ''.join(f'_v{sub.index}, ' for sub in step.steps)
+            env[f'_u{k}'] = step.codec.unpack_from
+            env[f'_R{k}'] = step
+            body.append('try:')
+            if step.slices:
+                body.append('    if ctx.zero_copy: raise LookupError')
+            body.append(f'    {targets}= _u{k}(raw, {index})')
+            for n, decode in step.decode:
+                var = f'_v{step.steps[n].index}'
+                env[f'_d{k}_{n}'] = decode
+                body.append(f'    {var} = _d{k}_{n}({var})')
+            body.extend([
+                'except Exception:',
+                f'    ctx.index = {index}',
+                '    _t = []',
+                f'    _R{k}.unpack(raw, ctx, _t)',
+                f'    {targets}= _t',
+            ])
+            offset += step.size
+            continue
+        if offset is not None:
+            body.append(f'ctx.index = {_offset(offset)}')
+            offset = None
+        value = f'_f{k}(raw, ctx)'
+        if step.unwrap is not IDENTITY:
+            env[f'_w{k}'] = step.unwrap
+            value = f'_w{k}({value})'
+        env[f'_f{k}'] = step.field._unpack
+        if checked is not None:
+            body.append(f'_v{step.index} = {value}')
+            continue
+        env[f'_l{k}'] = step.label
+        body.extend([
+            'try:',
+            f'    _v{step.index} = {value}',
+            'except (ValueError, OverflowError) as e:',
+            f"    raise e.__class__(f'{{_l{k}}}->{{e}}') from None",
+        ])
+    if offset is not None:
+        body.append(f'ctx.index = {_offset(offset)}')
+    if kwargs:
+        args = ', '.join(f'{name}=_v{n}' for n, name in enumerate(names, 0))
+    else:
+        args = ', '.join(f'_v{n}' for n in range(len(names)))
+    body.append(f'return cls({args})')
+    if checked is not None:
+        body = _trusted(body, 'cls, raw, ctx', env, checked)
+    return _create_fn('_unpack', 'cls, raw, ctx', body, env)
+
+def _fingerprint(field: Any) -> Tuple[int, str]:
+    """key field definition by identity and the repr of its mutable state"""
+    return (id(field), repr(getattr(field, '__metadata__', field)))
+
+def get_codec(fields: Sequence[Any]) -> 'Codec':
+    """
+    retrieve compiled codec for fields from the lru cache (or compile it)
+
+    fields are keyed by identity since most field definitions are
+    unhashable, along with their repr so mutated field definitions are
+    recompiled. cached codecs keep a reference to their fields so the
+    identities stay valid for as long as the entry is cached.
+
+    :param fields: list of fields used to serialize values
+    :return:       compiled codec for fields
+    """
+    key = tuple(map(_fingerprint, fields))
+    with CACHE_LOCK:
+        codec = CACHE.get(key)
+        if codec is not None:
+            CACHE.move_to_end(key)
+            return codec
+    codec = Codec(fields)
+    with CACHE_LOCK:
+        CACHE[key] = codec
+        if len(CACHE) > CACHE_SIZE:
+            CACHE.popitem(last=False)
+    return codec
+
+#** Classes **#
+
+class Codec:
+    """
+    Precompiled Sequence of Fields for Repeated Functional Pack/Unpack
+
+    field annotations and wrappers are resolved once on creation rather
+    than on every call, similar to `struct.Struct` versus `struct.pack`.
+    """
+    __slots__ = ('fields', 'steps', 'size')
+
+    def __init__(self, fields: Sequence[Any]):
+        """
+        :param fields: list of fields used to serialize values
+        """
+        items: List[StepItem] = []
+        for n, field in enumerate(fields, 0):
+            wrap, packer = deanno(field, f'field({n}) ')
+            name = packer.__class__.__name__
+            items.append((f'field({n})->{name}', wrap, packer))
+        sizes       = [field_size(packer) for _, _, packer in items]
+        self.fields = tuple(fields)
+        self.steps  = compile_steps(items)
+        self.size   = None if None in sizes else sum(sizes) #type: ignore
+
+    def __repr__(self) -> str:
+        return f'Codec({list(self.fields)!r})'
+
+    def _check(self, values: Sequence[Any]):
+        """validate number of values matches number of fields"""
+        if len(values) != len(self.fields):
+            nfields, nvalues = len(self.fields), len(values)
+            raise OverflowError(f'{nfields} fields vs {nvalues} values.')
+
+    def pack(self, *values: Any, ctx: Optional[Context] = None) -> bytes:
+        """
+        pack values into encoded bytes
+
+        :param values: list of values to match encoding fields
+        :param ctx:    serialization tracker for packaging multiple objects
+        :return:       packed bytes
+        """
+        self._check(values)
+        return pack_steps(self.steps, values, ctx or Context())
+
+    def pack_into(self, buffer: Buffer,
+        offset: int, *values: Any, ctx: Optional[Context] = None) -> int:
+        """
+        pack values directly into a preallocated writable buffer
+
+        :param buffer: bytearray, memoryview, mmap, etc. to write into
+        :param offset: offset within buffer to start writing
+        :param values: list of values to match encoding fields
+        :param ctx:    serialization tracker for packaging multiple objects
+        :return:       number of bytes written
+        """
+        self._check(values)
+        ctx  = ctx or Context()
+        view = writable(buffer)
+        return pack_steps_into(self.steps, values, view, offset, ctx)
+
+    def unpack(self, raw: Buffer,
+        ctx: Optional[Context] = None, zero_copy: bool = False) -> tuple:
+        """
+        unpack values from encoded bytes
+
+        :param raw:       raw encoded bytes (or any buffer object) to unpack
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
+        :return:          unpacked field values
+        """
+        ctx   = ctx or Context()
+        saved = ctx.zero_copy
+        ctx.zero_copy = saved or zero_copy
+        try:
+            return tuple(unpack_steps(self.steps, ctx.buffer(raw), ctx))
+        finally:
+            ctx.zero_copy = saved
+
+class FieldStep:
+    """
+    Single Field Serialization Step using the Field's own Pack/Unpack
+    """
+    __slots__ = ('index', 'label', 'wrap', 'unwrap', 'field')
+
+    def __init__(self, index: int, label: str, wrap: Wrapper, field: Field):
+        self.index  = index
+        self.label  = label
+        self.wrap   = wrap
+        self.unwrap = as_bytes if wrap is bytes else wrap
+        self.field  = field
+
+    def __repr__(self) -> str:
+        return f'FieldStep({self.label!r}, field={self.field!r})'
+
+    def pack(self, values: Sequence[Any], ctx: Context) -> bytes:
+        try:
+            value = self.wrap(values[self.index])
+            return self.field._pack(value, ctx)
+        except (ValueError, OverflowError) as e:
+            raise e.__class__(f'{self.label}->{e}') from None
+
+    def packed_size(self, values: Sequence[Any], ctx: Context) -> int:
+        value = self.wrap(values[self.index])
+        return field_packed_size(self.field, value, ctx)
+
+    def pack_into(self, values: Sequence[Any],
+        buffer: memoryview, offset: int, ctx: Context) -> int:
+        try:
+            value = self.wrap(values[self.index])
+            return pack_field_into(self.field, value, buffer, offset, ctx)
+        except (ValueError, OverflowError) as e:
+            raise e.__class__(f'{self.label}->{e}') from None
+
+    def skip(self, raw: Buffer, ctx: Context):
+        try:
+            skip_field(self.field, raw, ctx)
+        except (ValueError, OverflowError) as e:
+            raise e.__class__(f'{self.label}->{e}') from None
+
+    def unpack(self, raw: Buffer, ctx: Context, values: list):
+        try:
+            value = self.field._unpack(raw, ctx)
+            values.append(self.unwrap(value))
+        except (ValueError, OverflowError) as e:
+            raise e.__class__(f'{self.label}->{e}') from None
+
+class FixedRun:
+    """
+    Run of Fixed-Width Fields Merged into a Single `struct.Struct` Codec
+
+    any failure on the fast path falls back to the individual field steps
+    so error messages and context state remain identical. runs containing
+    slice fields also use the field steps when zero-copy is enabled.
+    """
+    __slots__ = (
+        'steps',
+        'fmts',
+        'order',
+        'codec',
+        'size',
+        'start',
+        'end',
+        'encode',
+        'decode',
+        'slices',
+    )
+
+    def __init__(self,
+        run: Sequence[Tuple[FieldStep, FixedFmt]], order: Optional[str] = None):
+        self.steps = [step for step, _ in run]
+        self.fmts  = [fmt for _, fmt in run]
+        self.order = order or '>'
+        self.codec = struct.Struct(
+            self.order + ''.join(fmt.fmt for fmt in self.fmts))
+        self.size  = self.codec.size
+        self.start = self.steps[0].index
+        self.end   = self.steps[-1].index + 1
+        self.slices = any(fmt.slices for _, fmt in run)
+        self.encode: List[Tuple[int, Wrapper]] = []
+        self.decode: List[Tuple[int, Wrapper]] = []
+        for n, (step, fmt) in enumerate(run, 0):
+            wrap = None if step.wrap in (IDENTITY, fmt.native) else step.wrap
+            encode = _chain(wrap, fmt.encode) \
+                if wrap and fmt.encode else wrap or fmt.encode
+            decode = _chain(fmt.decode, wrap) \
+                if wrap and fmt.decode else wrap or fmt.decode
+            if encode:
+                self.encode.append((n, encode))
+            if decode:
+                self.decode.append((n, decode))
+
+    def __repr__(self) -> str:
+        return f'FixedRun({self.codec.format!r})'
+
+    def pack(self, values: Sequence[Any], ctx: Context) -> bytes:
+        try:
+            args: Any = values[self.start:self.end]
+            if self.encode:
+                args = list(args)
+                for n, encode in self.encode:
+                    args[n] = encode(args[n])
+            data = self.codec.pack(*args)
+        except Exception:
+            return b''.join(step.pack(values, ctx) for step in self.steps)
+        ctx.index += self.size
+        return data
+
+    def packed_size(self, values: Sequence[Any], ctx: Context) -> int:
+        ctx.index += self.size
+        return self.size
+
+    def pack_into(self, values: Sequence[Any],
+        buffer: memoryview, offset: int, ctx: Context) -> int:
+        try:
+            args: Any = values[self.start:self.end]
+            if self.encode:
+                args = list(args)
+                for n, encode in self.encode:
+                    args[n] = encode(args[n])
+            self.codec.pack_into(buffer, offset, *args)
+        except Exception:
+            return pack_steps_into(self.steps, values, buffer, offset, ctx)
+        ctx.index += self.size
+        return self.size
+
+    def skip(self, raw: Buffer, ctx: Context):
+        if ctx.index + self.size > len(raw):
+            return skip_steps(self.steps, raw, ctx)
+        ctx.index += self.size
+
+    def unpack(self, raw: Buffer, ctx: Context, values: list):
+        try:
+            if ctx.zero_copy and self.slices:
+                raise LookupError('zero-copy slices require field steps')
+            items: Any = self.codec.unpack_from(raw, ctx.index)
+            if self.decode:
+                items = list(items)
+                for n, decode in self.decode:
+                    items[n] = decode(items[n])
+        except Exception:
+            for step in self.steps:
+                step.unpack(raw, ctx, values)
+            return
+        ctx.index += self.size
+        values.extend(items)
+
+    def unpack_rows(self,
+        raw: Buffer, ctx: Context, count: Optional[int] = None) -> List[Any]:
+        """
+        unpack as many complete back-to-back records as possible in bulk
+
+        returns an empty list on any failure so the caller may fall back
+        to decoding individual records with consistent errors.
+
+        :param raw:   raw buffer of back-to-back records
+        :param ctx:   deserialization tracker for packaging multiple objects
+        :param count: maximum number of records to unpack
+        :return:      list of decoded record value tuples/lists
+        """
+        total = (len(raw) - ctx.index) // self.size
+        total = total if count is None else min(count, total)
+        if total <= 0 or (ctx.zero_copy and self.slices):
+            return []
+        view = raw if isinstance(raw, memoryview) else memoryview(raw)
+        view = view[ctx.index:ctx.index + total * self.size]
+        try:
+            rows: List[Any] = list(self.codec.iter_unpack(view))
+            if self.decode:
+                rows = [list(row) for row in rows]
+                for row in rows:
+                    for n, decode in self.decode:
+                        row[n] = decode(row[n])
+        except Exception:
+            return []
+        ctx.index += total * self.size
+        return rows
+
+    def unpack_columns(self,
+        view: Buffer, count: int, container: Container) -> List[Any]:
+        """
+        unpack back-to-back records into per-field columns
+
+        integer and single/double float fields become `array.array`
+        columns while other fields are decoded into lists. the numpy
+        container returns raw column views over a structured dtype without
+        applying any decoders.
+
+        :param view:      raw buffer of exactly `count` back-to-back records
+        :param count:     number of records contained in the buffer
+        :param container: column container type (array or numpy)
+        :return:          list of columns in field order
+        """
+        if container == 'numpy':
+            import numpy
+            names   = [f'f{n}' for n in range(len(self.fmts))]
+            dtypes  = [self._dtype(fmt) for fmt in self.fmts]
+            dtype   = numpy.dtype(list(zip(names, dtypes)))
+            records = numpy.frombuffer(view, dtype, count)
+            return [records[name] for name in names]
+        columns = list(zip(*self.codec.iter_unpack(view))) \
+            or [()] * len(self.steps)
+        decode  = dict(self.decode)
+        results: List[Any] = []
+        for n, (column, fmt) in enumerate(zip(columns, self.fmts), 0):
+            if n in decode:
+                results.append(list(map(decode[n], column)))
+            elif fmt.native is int:
+                code = ARRAY_CODES[(fmt.size, fmt.fmt.islower())]
+                results.append(array(code, column))
+            elif fmt.native is float and fmt.fmt in 'fd':
+                results.append(array(fmt.fmt, column))
+            else:
+                results.append(list(column))
+        return results
+
+    def _dtype(self, fmt: FixedFmt) -> str:
+        """generate numpy dtype for field description"""
+        if fmt.native is int:
+            kind = 'i' if fmt.fmt.islower() else 'u'
+            return f'{self.order}{kind}{fmt.size}'
+        if fmt.native is float:
+            return f'{self.order}f{fmt.size}'
+        return f'S{fmt.size}' if fmt.native is bytes else f'V{fmt.size}'
@@ -6,7 +6,9 @@ from ipaddress import IPv4Address, IPv6Address
 from typing import ClassVar, List, Optional, Tuple
 from typing_extensions import Annotated
 
-from .abc import Context, Field
+from .abc import Buffer, Bytes, Context, Field, FixedFmt
+from .abc import DOMAIN_MAX_LABEL, DOMAIN_MAX_NAME
+from .abc import DomainLengthError, DomainPointerError
 
 #** Variables **#
 __all__ = [
@@ -28,22 +30,36 @@ class IPv4Field(Field[IPv4Address]):
     IPv4Address Serializer Field Definition
     """
 
+    def _fmt(self) -> Optional[FixedFmt]:
+        packed = lambda value: value.packed
+        return FixedFmt('4s', 4, None, IPv4Address, packed, IPv4Address)
+
+    def _size(self) -> Optional[int]:
+        return 4
+
     def _pack(self, value: IPv4Address, ctx: Context) -> bytes:
         return ctx.track_bytes(value.packed)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> IPv4Address:
-        return IPv4Address(ctx.slice(raw, 4))
+    def _unpack(self, raw: Buffer, ctx: Context) -> IPv4Address:
+        return IPv4Address(bytes(ctx.slice(raw, 4)))
 
 class IPv6Field(Field[IPv6Address]):
     """
     IPv6Address Serializer Field Definition
     """
 
+    def _fmt(self) -> Optional[FixedFmt]:
+        packed = lambda value: value.packed
+        return FixedFmt('16s', 16, None, IPv6Address, packed, IPv6Address)
+
+    def _size(self) -> Optional[int]:
+        return 16
+
     def _pack(self, value: IPv6Address, ctx: Context) -> bytes:
         return ctx.track_bytes(value.packed)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> IPv6Address:
-        return IPv6Address(ctx.slice(raw, 16))
+    def _unpack(self, raw: Buffer, ctx: Context) -> IPv6Address:
+        return IPv6Address(bytes(ctx.slice(raw, 16)))
 
 class MACField(Field[str]):
     """
@@ -51,73 +67,140 @@ class MACField(Field[str]):
     """
     replace: re.Pattern = re.compile('[:.-]')
 
-    def _pack(self, value: str, ctx: Context) -> bytes:
+    def _encode(self, value: str) -> bytes:
         packed = bytes.fromhex(self.replace.sub('', value))
         if len(packed) != 6:
             raise ValueError(f'invalid mac-address: {value!r}')
-        return ctx.track_bytes(packed)
+        return packed
+
+    def _decode(self, mac: Bytes) -> str:
+        return ':'.join(f'{i:02x}' for i in mac)
+
+    def _fmt(self) -> Optional[FixedFmt]:
+        return FixedFmt('6s', 6, None, str, self._encode, self._decode)
+
+    def _size(self) -> Optional[int]:
+        return 6
+
+    def _pack(self, value: str, ctx: Context) -> bytes:
+        return ctx.track_bytes(self._encode(value))
 
-    def _unpack(self, raw: bytes, ctx: Context) -> str:
+    def _unpack(self, raw: Buffer, ctx: Context) -> str:
         mac = ctx.slice(raw, 6)
         if len(mac) != 6:
             raise OverflowError('too little data to unpack macaddr(6)')
-        return ':'.join(f'{i:02x}' for i in mac)
+        return self._decode(mac)
 
 class DomainField(Field[bytes]):
     """
     DNS Domain Serializer Field Definition
+
+    pointers are resolved from labels previously decoded with the same
+    context by default. when `follow` is enabled pointers are instead
+    followed by jumping into the raw message at their offset, supporting
+    forward pointers and pointers into the middle of names, bounded by
+    `max_hops` to prevent pointer loops.
     """
+    __slots__ = ('follow', 'max_hops')
+
     ptr_mask: ClassVar[int] = 0xC0
 
+    def __init__(self, follow: bool = False, max_hops: int = 16):
+        """
+        :param follow:   follow pointers into the raw message when decoding
+        :param max_hops: maximum number of pointers followed per name
+        """
+        self.follow   = follow
+        self.max_hops = max_hops
+
+    def __repr__(self) -> str:
+        return f'DomainField(follow={self.follow!r})'
+
     def _pack(self, value: bytes, ctx: Context) -> bytes:
-        encoded = bytearray()
-        while value:
-            # check if ptr is an option for remaining domain
-            if value in ctx.domain_to_index:
-                index      = ctx.domain_to_index[value]
-                pointer    = index.to_bytes(2, 'big')
-                encoded   += bytes((pointer[0] | self.ptr_mask, pointer[1]))
-                ctx.index += 2
-                return bytes(encoded)
-            # save partial domain as index
-            ctx.save_domain(value, ctx.index)
-            # handle components of name
-            split       = value.split(b'.', 1)
-            name, value = split if len(split) == 2 else (split[0], b'')
-            encoded    += len(name).to_bytes(1, 'big') + name
-            ctx.index  += 1 + len(name)
-        # write final zeros before returning final encoded data
-        encoded   += b'\x00'
-        ctx.index += 1
-        return bytes(encoded)
-
-    def _unpack(self, raw: bytes, ctx: Context) -> bytes:
-        domain: List[Tuple[bytes, Optional[int]]] = []
+        return ctx.compress_domain(value)
+
+    def _packed_size(self, value: bytes, ctx: Context) -> int:
+        return len(ctx.compress_domain(value))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> bytes:
+        labels:  List[Tuple[int, bytes]] = []
+        pointer: Optional[int]           = None
+        size = 1
         while True:
             # check for length of domain component
+            ctx.require(raw, 1)
             length = raw[ctx.index]
             ctx.index += 1
             if length == 0:
                 break
             # check if name is a pointer
             if length & self.ptr_mask == self.ptr_mask:
-                name  = bytes((length ^ self.ptr_mask, raw[ctx.index]))
-                index = int.from_bytes(name, 'big')
-                base  = ctx.index_to_domain[index]
-                domain.append((base, None))
+                ctx.require(raw, 1)
+                pointer    = (length ^ self.ptr_mask) << 8 | raw[ctx.index]
                 ctx.index += 1
                 break
+            if length > DOMAIN_MAX_LABEL:
+                raise DomainLengthError(f'invalid label type: {length:#x}')
+            size += 1 + length
+            if size > DOMAIN_MAX_NAME:
+                raise DomainLengthError(f'domain exceeds {DOMAIN_MAX_NAME}')
             # slice name from bytes and updated counter
             idx  = ctx.index - 1
-            name = ctx.slice(raw, length)
-            domain.append((name, idx))
-        # save domain components
-        for n, (name, index) in enumerate(domain, 0):
-            if index is None:
+            ctx.require(raw, length)
+            name = bytes(ctx.slice(raw, length))
+            labels.append((idx, name))
+        if self.follow and pointer is not None:
+            names = self._follow(raw, pointer, size, labels)
+        else:
+            # resolve pointer by offset before saving labels for later use
+            names = [name for _, name in labels]
+            if pointer is not None:
+                names.extend(ctx.resolve_labels(pointer))
+        domain = b'.'.join(names)
+        if names and len(domain) + 2 > DOMAIN_MAX_NAME:
+            raise DomainLengthError(f'domain exceeds {DOMAIN_MAX_NAME}')
+        ctx.save_labels(labels, pointer)
+        return domain
+
+    def _follow(self, raw: Buffer, pointer: int,
+        size: int, labels: List[Tuple[int, bytes]]) -> List[bytes]:
+        """
+        follow domain pointers by jumping into the raw message
+
+        :param raw:     raw message being decoded
+        :param pointer: offset of the first pointer target
+        :param size:    encoded size of labels decoded so far
+        :param labels:  (offset, label) pairs decoded so far
+        :return:        complete list of domain labels
+        """
+        names = [name for _, name in labels]
+        index = pointer
+        hops  = 1
+        while True:
+            if index >= len(raw):
+                raise DomainPointerError(f'pointer out of bounds: {index}')
+            length = raw[index]
+            index += 1
+            if length == 0:
+                return names
+            if length & self.ptr_mask == self.ptr_mask:
+                if index >= len(raw):
+                    raise DomainPointerError(f'pointer out of bounds: {index}')
+                hops += 1
+                if hops > self.max_hops:
+                    raise DomainPointerError(
+                        f'domain exceeds {self.max_hops} pointer hops')
+                index = (length ^ self.ptr_mask) << 8 | raw[index]
                 continue
-            subname = b'.'.join(name for name, _ in domain[n:])
-            ctx.save_domain(subname, index)
-        return b'.'.join(name for name, _ in domain)
+            if length > DOMAIN_MAX_LABEL:
+                raise DomainLengthError(f'invalid label type: {length:#x}')
+            size += 1 + length
+            if size > DOMAIN_MAX_NAME:
+                raise DomainLengthError(f'domain exceeds {DOMAIN_MAX_NAME}')
+            if index + length > len(raw):
+                raise DomainPointerError(f'label out of bounds: {index}')
+            names.append(bytes(raw[index:index + length]))
+            index += length
 
 #** Annotations **#
 
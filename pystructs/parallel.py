@@ -0,0 +1,189 @@
+"""
+Parallel Bulk Record Decoding Across Worker Processes
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from mmap import ACCESS_READ, mmap
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing_extensions import get_args
+
+from .abc import Buffer, Context
+from .std import ColumnContainer
+
+#** Variables **#
+__all__ = ['record_chunks', 'unpack_file', 'unpack_parallel']
+
+#: (start offset, end offset, record count) of a record-aligned chunk
+Chunk = Tuple[int, int, int]
+
+#: column container to decode chunks into (or None to decode records)
+Columns = Optional[ColumnContainer]
+
+#: number of chunks generated per worker to balance uneven workloads
+CHUNKS_PER_WORKER = 4
+
+#** Functions **#
+
+def record_chunks(cls: Any, view: Buffer, chunks: int) -> List[Chunk]:
+    """
+    split back-to-back struct records into record-aligned chunks
+
+    fixed-width records are split by arithmetic alone while framed
+    records are located by skipping over them using their size hints.
+
+    :param cls:    struct definition of the records
+    :param view:   raw buffer of back-to-back records
+    :param chunks: number of chunks to aim for
+    :return:       list of record-aligned chunks
+    """
+    size = cls.__size__
+    if size is not None:
+        total = len(view) // size
+        if len(view) % size:
+            raise ValueError(f'trailing data after {total} records({size})')
+        step = max(1, -(-total // max(1, chunks)))
+        return [
+            (start * size, min(total, start + step) * size,
+                min(total, start + step) - start)
+            for start in range(0, total, step)
+        ]
+    target  = max(1, len(view) // max(1, chunks))
+    bounds: List[Chunk] = []
+    ctx     = Context()
+    start   = count = 0
+    while ctx.index < len(view):
+        cls._skip(view, ctx)
+        count += 1
+        if ctx.index - start >= target:
+            bounds.append((start, ctx.index, count))
+            start, count = ctx.index, 0
+    if count:
+        bounds.append((start, ctx.index, count))
+    return bounds
+
+def _check_columns(columns: Columns):
+    """ensure column container is supported before spawning any workers"""
+    if columns is not None and columns not in get_args(ColumnContainer):
+        raise ValueError(f'unsupported column container: {columns!r}')
+
+def _decode(cls: Any,
+    view: memoryview, count: int, columns: Columns) -> Any:
+    """decode records (or columns) from a record-aligned chunk"""
+    if columns is None:
+        return cls.unpack_many(view, count)
+    result = cls.unpack_columns(view, count, columns)
+    if columns == 'numpy':
+        result = {name: column.copy() for name, column in result.items()}
+    return result
+
+def _unpack_file_chunk(cls: Any, path: str,
+    chunk: Chunk, columns: Columns) -> Any:
+    """worker decoding a chunk of a memory-mapped file"""
+    start, end, count = chunk
+    with open(path, 'rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+        with memoryview(mm) as view, view[start:end] as raw:
+            return _decode(cls, raw, count, columns)
+
+def _unpack_shared_chunk(cls: Any, name: str,
+    chunk: Chunk, columns: Columns) -> Any:
+    """worker decoding a chunk of a shared memory block"""
+    start, end, count = chunk
+    shm = SharedMemory(name)
+    try:
+        with shm.buf[start:end] as raw: #type: ignore
+            return _decode(cls, raw, count, columns)
+    finally:
+        shm.close()
+
+def _merge(parts: Iterator[Any],
+    columns: Columns) -> Union[Iterator[Any], Dict[str, Any]]:
+    """merge decoded chunks into a record iterator or joined columns"""
+    if columns is None:
+        return (record for part in parts for record in part)
+    merged: Dict[str, List[Any]] = {}
+    for part in parts:
+        for name, column in part.items():
+            merged.setdefault(name, []).append(column)
+    if columns == 'numpy':
+        import numpy
+        return {name: numpy.concatenate(c) for name, c in merged.items()}
+    result: Dict[str, Any] = {}
+    for name, pieces in merged.items():
+        column = pieces[0]
+        for piece in pieces[1:]:
+            column.extend(piece)
+        result[name] = column
+    return result
+
+def _parts(func: Any, cls: Any, source: str, chunks: List[Chunk],
+    workers: Optional[int], columns: Columns) -> Iterator[Any]:
+    """decode chunks in order within a process pool (or in-process)"""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield func(cls, source, chunk, columns)
+        return
+    n = len(chunks)
+    with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+        yield from pool.map(
+            func, [cls] * n, [source] * n, chunks, [columns] * n)
+
+def unpack_file(cls: Any, path: Union[str, 'os.PathLike'],
+    workers: Optional[int] = None, columns: Columns = None) -> Any:
+    """
+    decode a file of back-to-back struct records across worker processes
+
+    the file is memory-mapped and split into record-aligned chunks. each
+    worker maps the file itself so no raw bytes are pickled between
+    processes and records are yielded in order as chunks complete.
+    struct classes must be importable by worker processes.
+
+    :param cls:     struct definition of the records
+    :param path:    path of file to decode
+    :param workers: number of worker processes (defaults to cpu count)
+    :param columns: return joined columns of this container type instead
+    :return:        ordered iterator of records (or dictionary of columns)
+    """
+    _check_columns(columns)
+    path = os.fspath(path)
+    if os.path.getsize(path) == 0:
+        return _merge(iter([]), columns)
+    with open(path, 'rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            nchunks = (workers or os.cpu_count() or 1) * CHUNKS_PER_WORKER
+            chunks  = record_chunks(cls, view, nchunks)
+    parts = _parts(_unpack_file_chunk, cls, path, chunks, workers, columns)
+    return _merge(parts, columns)
+
+def unpack_parallel(cls: Any, raw: Buffer,
+    workers: Optional[int] = None, columns: Columns = None) -> Any:
+    """
+    decode a buffer of back-to-back struct records across worker processes
+
+    the buffer is copied once into shared memory which workers attach to
+    directly so no raw bytes are pickled between processes. all chunks
+    are decoded before returning. struct classes must be importable by
+    worker processes.
+
+    :param cls:     struct definition of the records
+    :param raw:     raw encoded bytes (or any buffer object) to decode
+    :param workers: number of worker processes (defaults to cpu count)
+    :param columns: return joined columns of this container type instead
+    :return:        ordered iterator of records (or dictionary of columns)
+    """
+    _check_columns(columns)
+    view = Context(zero_copy=True).buffer(raw)
+    if not len(view):
+        return _merge(iter([]), columns)
+    nchunks = (workers or os.cpu_count() or 1) * CHUNKS_PER_WORKER
+    chunks  = record_chunks(cls, view, nchunks)
+    shm     = SharedMemory(create=True, size=len(view))
+    try:
+        shm.buf[:len(view)] = view #type: ignore
+        parts = list(_parts(
+            _unpack_shared_chunk, cls, shm.name, chunks, workers, columns))
+    finally:
+        shm.close()
+        shm.unlink()
+    return _merge(iter(parts), columns)
@@ -0,0 +1,198 @@
+"""
+Opt-In Per-Field Serialization Profiling
+"""
+import pstats
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing_extensions import TypeGuard
+
+from pyderive import dataclass
+
+from .abc import Buffer, Context
+from .struct import Struct
+
+#** Variables **#
+__all__ = ['FieldStats', 'Profiler']
+
+S = TypeVar('S', bound=Struct)
+
+#: operation names tracked by the profiler
+OPERATIONS = ('pack', 'unpack')
+
+#** Functions **#
+
+def _is_struct(field: Any) -> TypeGuard[Type[Struct]]:
+    """check if field is a nested struct definition"""
+    return isinstance(field, type) and issubclass(field, Struct)
+
+#** Classes **#
+
+@dataclass(slots=True)
+class FieldStats:
+    """
+    Accumulated Statistics of a Single Struct or Struct Field
+    """
+    calls:    int = 0
+    ns:       int = 0
+    nbytes:   int = 0
+    child_ns: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        :return: statistics as a dictionary
+        """
+        return {'calls': self.calls, 'ns': self.ns, 'bytes': self.nbytes}
+
+class Profiler:
+    """
+    Struct Serializer Recording Per-Class and Per-Field Statistics
+
+    profiling runs through a separate instrumented path over the compiled
+    struct steps so the regular pack/unpack paths carry no overhead. runs
+    of fixed-width fields are timed field-by-field rather than as a single
+    merged `struct.Struct` call, so timings are best compared relatively.
+    """
+    __slots__ = ('stats', )
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, FieldStats]] = {}
+        self.reset()
+
+    def reset(self):
+        """
+        discard all recorded statistics
+        """
+        self.stats = {op: {} for op in OPERATIONS}
+
+    def _record(self, op: str,
+        label: str, parent: Optional[str], ns: int, nbytes: int):
+        """record a single timed call"""
+        table = self.stats[op]
+        stats = table.get(label)
+        if stats is None:
+            stats = table[label] = FieldStats()
+        stats.calls  += 1
+        stats.ns     += ns
+        stats.nbytes += nbytes
+        if parent is not None:
+            table.setdefault(parent, FieldStats()).child_ns += ns
+
+    def _pack(self, cls: Type[Struct],
+        value: Struct, ctx: Context, parent: Optional[str] = None) -> bytes:
+        """instrumented struct pack"""
+        start  = perf_counter_ns()
+        values = cls.__getter__(value)
+        name   = cls.__name__
+        self.stats['pack'].setdefault(name, FieldStats())
+        raw = bytearray()
+        for step in cls.__layout__:
+            began = perf_counter_ns()
+            if _is_struct(step.field):
+                try:
+                    item = step.wrap(values[step.index])
+                    data = self._pack(step.field, item, ctx, step.label)
+                except (ValueError, OverflowError) as e:
+                    raise e.__class__(f'{step.label}->{e}') from None
+            else:
+                data = step.pack(values, ctx)
+            raw += data
+            ns   = perf_counter_ns() - began
+            self._record('pack', step.label, name, ns, len(data))
+        ns = perf_counter_ns() - start
+        self._record('pack', name, parent, ns, len(raw))
+        return bytes(raw)
+
+    def _unpack(self, cls: Type[S],
+        raw: Buffer, ctx: Context, parent: Optional[str] = None) -> S:
+        """instrumented struct unpack"""
+        start  = perf_counter_ns()
+        index  = ctx.index
+        name   = cls.__name__
+        values: List[Any] = []
+        self.stats['unpack'].setdefault(name, FieldStats())
+        for step in cls.__layout__:
+            began  = perf_counter_ns()
+            offset = ctx.index
+            if _is_struct(step.field):
+                try:
+                    value = self._unpack(step.field, raw, ctx, step.label)
+                    values.append(step.unwrap(value))
+                except (ValueError, OverflowError) as e:
+                    raise e.__class__(f'{step.label}->{e}') from None
+            else:
+                step.unpack(raw, ctx, values)
+            ns = perf_counter_ns() - began
+            self._record('unpack', step.label, name, ns, ctx.index - offset)
+        value = cls._construct(values)
+        ns    = perf_counter_ns() - start
+        self._record('unpack', name, parent, ns, ctx.index - index)
+        return value
+
+    def pack(self, value: Struct, ctx: Optional[Context] = None) -> bytes:
+        """
+        pack struct fields into encoded bytes while recording statistics
+
+        :param value: struct instance to pack
+        :param ctx:   serialization tracker for packaging multiple objects
+        :return:      packed bytes
+        """
+        return self._pack(type(value), value, ctx or Context())
+
+    def unpack(self, cls: Type[S], raw: Buffer,
+        ctx: Optional[Context] = None, zero_copy: bool = False) -> S:
+        """
+        unpack struct fields from encoded bytes while recording statistics
+
+        :param cls:       struct definition to unpack
+        :param raw:       raw encoded bytes (or any buffer object) to unpack
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
+        :return:          unpacked struct object
+        """
+        ctx   = ctx or Context()
+        saved = ctx.zero_copy
+        ctx.zero_copy = saved or zero_copy
+        try:
+            return self._unpack(cls, ctx.buffer(raw), ctx)
+        finally:
+            ctx.zero_copy = saved
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        export recorded statistics for metrics pipelines
+
+        :return: {operation: {label: {calls, ns, bytes}}}
+        """
+        return {
+            op: {label: stats.to_dict() for label, stats in table.items()}
+            for op, table in self.stats.items()
+        }
+
+    def _pstats(self) -> Dict[Tuple[str, int, str], tuple]:
+        """build `cProfile` style statistics table"""
+        table: Dict[Tuple[str, int, str], tuple] = {}
+        for op, entries in self.stats.items():
+            for label, stats in entries.items():
+                key = ('pystructs', 0, f'{op} {label}')
+                own = max(0, stats.ns - stats.child_ns) / 1e9
+                table[key] = (
+                    stats.calls, stats.calls, own, stats.ns / 1e9, {})
+        return table
+
+    def to_pstats(self) -> pstats.Stats:
+        """
+        export recorded statistics as a `pstats.Stats` object
+
+        :return: statistics for sorting and printing like `cProfile` output
+        """
+        return pstats.Stats(_StatsSource(self._pstats())) #type: ignore
+
+class _StatsSource:
+    """minimal `cProfile.Profile` lookalike accepted by `pstats.Stats`"""
+    __slots__ = ('stats', )
+
+    def __init__(self, stats: Dict[Tuple[str, int, str], tuple]):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
@@ -1,12 +1,19 @@
 """
 Standard Serializer Type Defintions
 """
-from typing import Any, List, Literal, Tuple, Union
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated, _AnnotatedAlias
 
 from pyderive import dataclass
 
-from .abc import T, Context, Field, Wrapper, deanno
+from .abc import IDENTITY, T, Buffer, Bytes, Context, Field, FixedFmt, Wrapper
+from .abc import B, deanno
+from .abc import IncompleteError, StreamContext
+from .abc import field_packed_size, field_size, pack_field_into, write_into
+from .abc import skip_field, writable
 
 #** Variables **#
 __all__ = [
@@ -15,6 +22,12 @@ __all__ = [
     'IntHint',
     'IntFmt',
     'IntField',
+    'IntArray',
+    'FloatFmt',
+    'FloatField',
+    'VarIntField',
+    'BitFields',
+    'BitStruct',
 
     'HintedBytes',
     'StaticBytes',
@@ -24,7 +37,10 @@ __all__ = [
     'StaticList',
     'GreedyList',
 
+    'HintedStruct',
+
     'Const',
+    'Switch',
 
     'I8',
     'I16',
@@ -38,16 +54,61 @@ __all__ = [
     'U48',
     'U64',
     'U128',
+    'F16',
+    'F32',
+    'F64',
+    'VarInt',
+    'ZigZag',
 ]
 
-IntHint = Union['IntField', _AnnotatedAlias]
+IntHint   = Union['IntField', 'VarIntField', _AnnotatedAlias]
+HintField = Union['IntField', 'VarIntField']
 
 IntFmt  = Literal['big', 'little']
 IntSize = Literal[1, 2, 4, 6, 8, 16, 32]
 
+FloatFmt  = Literal['big', 'little']
+FloatSize = Literal[2, 4, 8]
+
+#: integer-size to `struct` format-character for natively supported sizes
+INT_FORMATS = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+#: integer byte-order to `struct` byte-order prefix
+INT_ORDERS = {'big': '>', 'little': '<'}
+
+#: float-size to `struct` format-character
+FLOAT_FORMATS = {2: 'e', 4: 'f', 8: 'd'}
+
+#: precompiled (float-size, byte-order) to `struct.Struct` codecs
+FLOAT_STRUCTS: Dict[Tuple[int, str], struct.Struct] = {
+    (size, order): struct.Struct(f'{prefix}{char}')
+    for size, char in FLOAT_FORMATS.items()
+    for order, prefix in INT_ORDERS.items()
+}
+
+#: (field name, bit shift, bit mask) of a single bit-struct sub-field
+BitSpec = Tuple[str, int, int]
+
+#: largest tag value dispatched through a precomputed list table
+SWITCH_TABLE_MAX = 0xFF
+
+#: preencoded single byte varints
+VARINT_BYTES = [bytes((n, )) for n in range(0x80)]
+
+#: list container types supported for bulk integer lists
+Container = Literal['list', 'array', 'numpy']
+
+#: column container types supported when decoding records by column
+ColumnContainer = Literal['array', 'numpy']
+
+#: (integer-size, signed) to `array.array` typecode for supported sizes
+ARRAY_CODES: Dict[Tuple[int, bool], str] = {}
+for _code in 'qQlLiIhHbB':
+    ARRAY_CODES[(array(_code).itemsize, _code.islower())] = _code
+
 #** Functions **#
 
-def deanno_int(anno: Any, prefix: str = '') -> Tuple[Wrapper, 'IntField']:
+def deanno_int(anno: Any, prefix: str = '') -> Tuple[Wrapper, HintField]:
     """
     retrieve int-field definition from annotated type (if required)
 
@@ -56,10 +117,119 @@ def deanno_int(anno: Any, prefix: str = '') -> Tuple[Wrapper, 'IntField']:
     :return:       (field value wrappper, field object definition)
     """
     wrapper, field = deanno(anno, prefix)
-    if not isinstance(field, IntField):
+    if not isinstance(field, (IntField, VarIntField)):
         raise TypeError(f'{prefix}invalid integer annotation: {anno!r}')
     return wrapper, field
 
+def rstrip_nulls(value: Bytes) -> Bytes:
+    """
+    strip trailing null bytes from bytes or memoryview without copying
+
+    :param value: bytes or memoryview to strip
+    :return:      stripped value of the same type
+    """
+    if not isinstance(value, memoryview):
+        return value.rstrip(b'\x00')
+    end = len(value)
+    while end and value[end - 1] == 0:
+        end -= 1
+    return value[:end]
+
+def items_packed_size(item: Field[T], values: List[T], ctx: Context) -> int:
+    """
+    calculate encoded size of list items without serializing them
+
+    :param item:   list item field definition
+    :param values: list of item values
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       encoded size of all items in bytes
+    """
+    size = field_size(item)
+    if size is None:
+        return sum(field_packed_size(item, value, ctx) for value in values)
+    ctx.index += size * len(values)
+    return size * len(values)
+
+def pack_items(item: Field[T],
+    bulk: Optional['IntArray'], values: List[T], ctx: Context) -> bytes:
+    """
+    pack list items using bulk serializer when available
+
+    :param item:   list item field definition
+    :param bulk:   bulk integer serializer (if supported)
+    :param values: list of item values
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       packed bytes
+    """
+    if bulk is not None:
+        try:
+            return ctx.track_bytes(bulk.pack(values))
+        except Exception:
+            pass # fallback to item serializer for consistent errors
+    return b''.join(item._pack(value, ctx) for value in values)
+
+def pack_items_into(item: Field[T], bulk: Optional['IntArray'],
+    values: List[T], buffer: memoryview, offset: int, ctx: Context) -> int:
+    """
+    pack list items directly into buffer using bulk serializer when available
+
+    :param item:   list item field definition
+    :param bulk:   bulk integer serializer (if supported)
+    :param values: list of item values
+    :param buffer: writable buffer to write into
+    :param offset: offset within buffer to start writing
+    :param ctx:    serialization tracker for packaging multiple objects
+    :return:       number of bytes written
+    """
+    if bulk is not None:
+        return write_into(buffer, offset, pack_items(item, bulk, values, ctx))
+    start = offset
+    for value in values:
+        offset += pack_field_into(item, value, buffer, offset, ctx)
+    return offset - start
+
+def unpack_items(item: Field[T], wrap: Wrapper,
+    bulk: Optional['IntArray'], raw: Buffer, ctx: Context, count: int) -> Any:
+    """
+    unpack list items using bulk serializer when available
+
+    :param item:  list item field definition
+    :param wrap:  list item value wrapper
+    :param bulk:  bulk integer serializer (if supported)
+    :param raw:   raw bytes to unpack from
+    :param ctx:   deserialization tracker for packaging multiple objects
+    :param count: number of items to unpack
+    :return:      unpacked list items
+    """
+    if bulk is None:
+        # report the whole block of fixed-size items as missing at once
+        size = field_size(item)
+        if size is not None:
+            ctx.require(raw, size * count)
+        return [wrap(item._unpack(raw, ctx)) for _ in range(count)]
+    size = bulk.field.size
+    data = ctx.slice(raw, size * count)
+    if len(data) != size * count:
+        raise ValueError(f'too little data to unpack integer({size})')
+    return bulk.unpack(data)
+
+def skip_items(item: Field[T], raw: Buffer, ctx: Context, count: int):
+    """
+    advance context index past list items without decoding them
+
+    :param item:  list item field definition
+    :param raw:   raw bytes being unpacked
+    :param ctx:   deserialization tracker for packaging multiple objects
+    :param count: number of items to skip
+    """
+    size = field_size(item)
+    if size is None:
+        for _ in range(count):
+            skip_field(item, raw, ctx)
+        return
+    ctx.require(raw, size * count)
+    ctx.index += size * count
+
 #** Classes **#
 
 @dataclass(slots=True)
@@ -71,78 +241,426 @@ class IntField(Field[int]):
     format: IntFmt  = 'big'
     signed: bool    = True
 
+    def _fmt(self) -> Optional[FixedFmt]:
+        char = INT_FORMATS.get(self.size)
+        if char is None:
+            return None
+        char  = char if self.signed else char.upper()
+        order = INT_ORDERS[self.format] if self.size > 1 else None
+        return FixedFmt(char, self.size, order, int)
+
+    def _size(self) -> Optional[int]:
+        return self.size
+
     def _pack(self, value: int, ctx: Context) -> bytes:
         packed = value.to_bytes(self.size, self.format, signed=self.signed)
         ctx.track_bytes(packed)
         return packed
 
-    def _unpack(self, raw: bytes, ctx: Context) -> int:
+    def _unpack(self, raw: Buffer, ctx: Context) -> int:
         val = ctx.slice(raw, self.size)
         if len(val) != self.size:
             raise ValueError(f'too little data to unpack integer({self.size})')
         return int.from_bytes(val, self.format, signed=self.signed)
 
-class HintedBytes(Field[bytes]):
+@dataclass(slots=True)
+class FloatField(Field[float]):
+    """
+    IEEE-754 Floating Point Serializer Definition
+    """
+    size:   FloatSize = 4
+    format: FloatFmt  = 'big'
+
+    def _fmt(self) -> Optional[FixedFmt]:
+        order = INT_ORDERS[self.format]
+        return FixedFmt(FLOAT_FORMATS[self.size], self.size, order, float)
+
+    def _size(self) -> Optional[int]:
+        return self.size
+
+    def _pack(self, value: float, ctx: Context) -> bytes:
+        packed = FLOAT_STRUCTS[(self.size, self.format)].pack(value)
+        ctx.track_bytes(packed)
+        return packed
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> float:
+        codec = FLOAT_STRUCTS[(self.size, self.format)]
+        if ctx.index + self.size > len(raw):
+            ctx.require(raw, self.size)
+            raise ValueError(f'too little data to unpack float({self.size})')
+        value = codec.unpack_from(raw, ctx.index)[0]
+        ctx.index += self.size
+        return value
+
+@dataclass(slots=True)
+class VarIntField(Field[int]):
+    """
+    LEB128 (Protobuf-Style) Variable-Length Integer Serializer Definition
+
+    `zigzag` maps signed integers onto unsigned ones so that small negative
+    values also encode into few bytes. `bits` limits the decoded integer.
+    """
+    zigzag: bool = False
+    bits:   int  = 64
+
+    def _encode(self, value: int) -> int:
+        """validate and convert value into unsigned integer to encode"""
+        if self.zigzag:
+            limit = 1 << (self.bits - 1)
+            if -limit <= value < limit:
+                return value << 1 if value >= 0 else (-value << 1) - 1
+        elif 0 <= value < 1 << self.bits:
+            return value
+        kind = 'zigzag' if self.zigzag else 'varint'
+        raise OverflowError(f'int out of range for {kind}({self.bits})')
+
+    def _decode(self, value: int) -> int:
+        """convert decoded unsigned integer into field value"""
+        return (value >> 1) ^ -(value & 1) if self.zigzag else value
+
+    def _packed_size(self, value: int, ctx: Context) -> int:
+        size = max(1, -(-self._encode(value).bit_length() // 7))
+        ctx.index += size
+        return size
+
+    def _pack(self, value: int, ctx: Context) -> bytes:
+        value = self._encode(value)
+        if value < 0x80:
+            return ctx.track_bytes(VARINT_BYTES[value])
+        data = bytearray()
+        while value > 0x7F:
+            data.append((value & 0x7F) | 0x80)
+            value >>= 7
+        data.append(value)
+        return ctx.track_bytes(bytes(data))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> int:
+        index = ctx.index
+        if index < len(raw) and raw[index] < 0x80:
+            ctx.index += 1
+            return self._decode(raw[index])
+        limit = -(-self.bits // 7)
+        value = shift = 0
+        for n in range(index, min(len(raw), index + limit)):
+            byte   = raw[n]
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                if value >> self.bits:
+                    raise ValueError(f'varint exceeds {self.bits} bits')
+                ctx.index = n + 1
+                return self._decode(value)
+            shift += 7
+        if len(raw) - index >= limit:
+            raise ValueError(f'varint longer than {limit} bytes')
+        if isinstance(ctx, StreamContext):
+            ctx.require(raw, len(raw) - index + 1)
+        raise ValueError('too little data to unpack varint')
+
+class BitFields:
+    """
+    Named Bit-Field Values Decoded from a Single Integer Word
+
+    may be constructed from another bit-fields object, a dictionary and/or
+    keyword sub-field values. sub-fields left unset are packed as zero.
+    """
+
+    def __init__(self, fields: Any = None, **kwargs: int):
+        if fields is not None:
+            values = fields if isinstance(fields, dict) else vars(fields)
+            self.__dict__.update(values)
+        self.__dict__.update(kwargs)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BitFields):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def asdict(self) -> Dict[str, int]:
+        """
+        :return: dictionary of sub-field values
+        """
+        return dict(self.__dict__)
+
+class BitStruct(Field[BitFields]):
+    """
+    Named Bit-Fields Packed Within a Single Integer Word
+
+    sub-fields are declared in order as `name=bit-width` starting from the
+    most significant bit of the word. every sub-field is decoded from a
+    single integer read using precomputed shifts and masks.
+    """
+    __slots__ = ('hint', 'bits')
+
+    def __init__(self, hint: IntHint, **widths: int):
+        field = deanno_int(hint, 'BitStruct ')[1]
+        if not isinstance(field, IntField) or field.signed:
+            raise TypeError(f'BitStruct requires unsigned integer: {hint!r}')
+        total = field.size * 8
+        if sum(widths.values()) > total:
+            raise ValueError(f'bit-fields exceed {total} bits of {field!r}')
+        self.hint: IntField      = field
+        self.bits: List[BitSpec] = []
+        for name, width in widths.items():
+            if width < 1:
+                raise ValueError(f'invalid bit-width for {name!r}: {width}')
+            total -= width
+            self.bits.append((name, total, (1 << width) - 1))
+
+    def __repr__(self) -> str:
+        widths = ', '.join(
+            f'{name}={mask.bit_length()}' for name, _, mask in self.bits)
+        return f'BitStruct(hint={self.hint!r}, {widths})'
+
+    def _check(self, name: str, bits: int, mask: int) -> int:
+        """ensure sub-field value fits within its bit-width"""
+        if not 0 <= bits <= mask:
+            raise OverflowError(
+                f'{name}={bits} out of range for {mask.bit_length()} bits')
+        return bits
+
+    def _encode(self, value: Any) -> int:
+        """pack sub-field values into a single integer word"""
+        fields = value if isinstance(value, dict) else None
+        word   = 0
+        for name, shift, mask in self.bits:
+            bits  = fields.get(name, 0) if fields is not None \
+                else getattr(value, name, 0)
+            word |= self._check(name, bits, mask) << shift
+        return word
+
+    def _decode(self, word: int) -> BitFields:
+        """unpack sub-field values from a single integer word"""
+        fields = BitFields()
+        fields.__dict__.update(
+            {name: word >> shift & mask for name, shift, mask in self.bits})
+        return fields
+
+    def _fmt(self) -> Optional[FixedFmt]:
+        fmt = self.hint._fmt()
+        if fmt is None:
+            return None
+        return FixedFmt(fmt.fmt, fmt.size,
+            fmt.order, BitFields, self._encode, self._decode)
+
+    def _size(self) -> Optional[int]:
+        return self.hint.size
+
+    def _pack(self, value: Any, ctx: Context) -> bytes:
+        return self.hint._pack(self._encode(value), ctx)
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> BitFields:
+        return self._decode(self.hint._unpack(raw, ctx))
+
+    def update_into(self, buffer: Buffer, offset: int = 0, **values: int):
+        """
+        update individual sub-fields of a packed word in place
+
+        :param buffer: writable buffer containing the packed word
+        :param offset: offset of the packed word within the buffer
+        :param values: sub-field values to update
+        """
+        view  = writable(buffer)
+        size  = self.hint.size
+        order = self.hint.format
+        if offset + size > len(view):
+            raise ValueError(f'too little data to unpack integer({size})')
+        word = int.from_bytes(view[offset:offset + size], order)
+        for name, shift, mask in self.bits:
+            if name in values:
+                bits = self._check(name, values.pop(name), mask)
+                word = word & ~(mask << shift) | bits << shift
+        if values:
+            raise TypeError(f'unknown bit-fields: {", ".join(values)}')
+        view[offset:offset + size] = word.to_bytes(size, order)
+
+class IntArray:
+    """
+    Bulk Integer List Serializer backed by `array.array`
+
+    encodes/decodes homogeneous lists of fixed-size integers in a single
+    call rather than serializing each item individually.
+    """
+    __slots__ = ('field', 'code', 'swap', 'dtype', 'container')
+
+    def __init__(self, field: IntField, container: Container = 'list'):
+        kind = 'i' if field.signed else 'u'
+        self.field     = field
+        self.code      = ARRAY_CODES[(field.size, field.signed)]
+        self.swap      = field.size > 1 and field.format != sys.byteorder
+        self.dtype     = f'{INT_ORDERS[field.format]}{kind}{field.size}'
+        self.container = container
+        if container == 'numpy':
+            import numpy # ensure numpy is installed when requested
+
+    def __repr__(self) -> str:
+        return f'IntArray(field={self.field!r}, container={self.container!r})'
+
+    @classmethod
+    def compile(cls, item: Field, wrap: Wrapper,
+        container: Container = 'list') -> Optional['IntArray']:
+        """
+        compile bulk integer serializer for list item (if supported)
+
+        :param item:      list item field definition
+        :param wrap:      list item value wrapper
+        :param container: container type returned on unpack
+        :return:          bulk serializer (if supported)
+        """
+        if isinstance(item, IntField) \
+            and wrap in (IDENTITY, int) \
+            and (item.size, item.signed) in ARRAY_CODES:
+            return cls(item, container)
+        if container != 'list':
+            raise TypeError(f'{container} container unsupported for {item!r}')
+        return None
+
+    def pack(self, values: Any) -> bytes:
+        """
+        pack integers into bytes in a single call
+
+        :param values: list, array or numpy array of integers
+        :return:       packed bytes
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            dtype = numpy.dtype(self.dtype)
+            if values.dtype.kind == dtype.kind \
+                and values.dtype.itemsize == dtype.itemsize:
+                return values.astype(dtype).tobytes()
+        items = array(self.code, values)
+        if self.swap:
+            items.byteswap()
+        return items.tobytes()
+
+    def unpack(self, data: Bytes) -> Any:
+        """
+        unpack integers from bytes in a single call
+
+        :param data: raw bytes containing only packed integers
+        :return:     list, array or numpy array of integers
+        """
+        if self.container == 'numpy':
+            import numpy
+            return numpy.frombuffer(data, self.dtype)
+        items = array(self.code)
+        items.frombytes(data)
+        if self.swap:
+            items.byteswap()
+        return items if self.container == 'array' else items.tolist()
+
+class HintedBytes(Field[Bytes]):
     """
     Arbitrary Bytes Serializer with Prefixed Sizehint
     """
     __slots__ = ('hint', )
 
     def __init__(self, hint: IntHint):
-        self.hint: IntField = deanno_int(hint, 'HintedBytes ')[1]
+        self.hint: HintField = deanno_int(hint, 'HintedBytes ')[1]
 
     def __repr__(self) -> str:
         return f'HintedBytes(hint={self.hint!r})'
 
-    def _pack(self, value: bytes, ctx: Context) -> bytes:
+    def _pack(self, value: Bytes, ctx: Context) -> bytes:
         hint = self.hint._pack(len(value), ctx)
         return hint + ctx.track_bytes(value)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> bytes:
+    def _packed_size(self, value: Bytes, ctx: Context) -> int:
+        size = field_packed_size(self.hint, len(value), ctx)
+        ctx.index += len(value)
+        return size + len(value)
+
+    def _pack_into(self,
+        value: Bytes, buffer: memoryview, offset: int, ctx: Context) -> int:
+        size  = pack_field_into(self.hint, len(value), buffer, offset, ctx)
+        size += write_into(buffer, offset + size, ctx.track_bytes(value))
+        return size
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        size = self.hint._unpack(raw, ctx)
+        ctx.require(raw, size)
+        ctx.index += size
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> Bytes:
         size = self.hint._unpack(raw, ctx)
         return ctx.slice(raw, size)
 
 @dataclass(slots=True)
-class StaticBytes(Field[bytes]):
+class StaticBytes(Field[Bytes]):
     """
     Arbitary Bytes Serializer of Fixed Static Bytesize
     """
     size: int
 
-    def _pack(self, value: bytes, ctx: Context) -> bytes:
+    def _encode(self, value: Bytes) -> bytes:
         if len(value) > self.size:
             raise OverflowError(f'length of bytes greater than {self.size}')
-        data = value.ljust(self.size, b'\x00')
+        return bytes(value) if isinstance(value, memoryview) else value
+
+    def _fmt(self) -> Optional[FixedFmt]:
+        return FixedFmt(f'{self.size}s', self.size, None, bytes,
+            self._encode, rstrip_nulls, slices=True)
+
+    def _size(self) -> Optional[int]:
+        return self.size
+
+    def _pack(self, value: Bytes, ctx: Context) -> bytes:
+        data = self._encode(value).ljust(self.size, b'\x00')
         return ctx.track_bytes(data)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> bytes:
+    def _pack_into(self,
+        value: Bytes, buffer: memoryview, offset: int, ctx: Context) -> int:
+        data = self._encode(value)
+        size = len(data)
+        write_into(buffer, offset + size, bytes(self.size - size))
+        buffer[offset:offset + size] = data
+        ctx.index += self.size
+        return self.size
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> Bytes:
         value = ctx.slice(raw, self.size)
         if len(value) != self.size:
             raise ValueError(f'too little data to unpack slice({self.size})')
-        return value.rstrip(b'\x00')
+        return rstrip_nulls(value)
 
-class GreedyBytes(Field[bytes]):
+class GreedyBytes(Field[Bytes]):
     """
     Arbitrary Bytes Serializer of Unlimited Size
     """
 
-    def _pack(self, value: bytes, ctx: Context) -> bytes:
-        return ctx.track_bytes(value)
+    def _pack(self, value: Bytes, ctx: Context) -> bytes:
+        return ctx.track_bytes(bytes(value))
+
+    def _packed_size(self, value: Bytes, ctx: Context) -> int:
+        ctx.index += len(value)
+        return len(value)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> bytes:
-        return ctx.slice(raw, len(raw))
+    def _pack_into(self,
+        value: Bytes, buffer: memoryview, offset: int, ctx: Context) -> int:
+        return write_into(buffer, offset, ctx.track_bytes(value))
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        ctx.index = max(ctx.index, len(raw))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> Bytes:
+        return ctx.slice(raw, len(raw) - ctx.index)
 
 class HintedList(Field[List[T]]):
     """
     Object List Serializer with Prefixed Sizehint
     """
-    __slots__ = ('hint', 'item', 'wrap')
+    __slots__ = ('hint', 'item', 'wrap', 'array')
 
-    def __init__(self, hint: IntHint, item: Union[Field[T], _AnnotatedAlias]):
+    def __init__(self, hint: IntHint,
+        item: Union[Field[T], _AnnotatedAlias], container: Container = 'list'):
         wrap, item = deanno(item, 'HintedList ')
-        self.hint: IntField = deanno_int(hint, 'HintedList ')[1]
+        self.hint: HintField = deanno_int(hint, 'HintedList ')[1]
         self.item: Field[T] = item
         self.wrap: Wrapper  = wrap
+        self.array = IntArray.compile(item, wrap, container)
 
     def __repr__(self) -> str:
         return f'HintedList(hint={self.hint!r}, item={self.item!r})'
@@ -150,25 +668,40 @@ class HintedList(Field[List[T]]):
     def _pack(self, value: List[T], ctx: Context) -> bytes:
         data  = bytearray()
         data += self.hint._pack(len(value), ctx)
-        for item in value:
-            data += self.item._pack(item, ctx)
+        data += pack_items(self.item, self.array, value, ctx)
         return bytes(data)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> List[T]:
-        size  = self.hint._unpack(raw, ctx)
-        return [self.wrap(self.item._unpack(raw, ctx)) for _ in range(size)]
+    def _packed_size(self, value: List[T], ctx: Context) -> int:
+        size = field_packed_size(self.hint, len(value), ctx)
+        return size + items_packed_size(self.item, value, ctx)
+
+    def _pack_into(self,
+        value: List[T], buffer: memoryview, offset: int, ctx: Context) -> int:
+        size  = pack_field_into(self.hint, len(value), buffer, offset, ctx)
+        size += pack_items_into(
+            self.item, self.array, value, buffer, offset + size, ctx)
+        return size
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        skip_items(self.item, raw, ctx, self.hint._unpack(raw, ctx))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> List[T]:
+        size = self.hint._unpack(raw, ctx)
+        return unpack_items(self.item, self.wrap, self.array, raw, ctx, size)
 
 class StaticList(Field[List[T]]):
     """
     Object List Serializer of Fixed Static Bytesize
     """
-    __slots__ = ('size', 'item', 'wrap')
+    __slots__ = ('size', 'item', 'wrap', 'array')
 
-    def __init__(self, size: int, item: Union[Field[T], _AnnotatedAlias]):
+    def __init__(self, size: int,
+        item: Union[Field[T], _AnnotatedAlias], container: Container = 'list'):
         wrapper, item = deanno(item, 'StaticList ')
         self.size: int      = size
         self.item: Field[T] = item
         self.wrap: Wrapper  = wrapper
+        self.array = IntArray.compile(item, wrapper, container)
 
     def __repr__(self) -> str:
         return f'StaticList(size={self.size}, item={self.item!r})'
@@ -176,35 +709,137 @@ class StaticList(Field[List[T]]):
     def _pack(self, value: List[T], ctx: Context) -> bytes:
         if len(value) > self.size:
             raise OverflowError(f'length of list greater than {self.size}')
-        return b''.join(self.item._pack(item, ctx) for item in value)
+        return pack_items(self.item, self.array, value, ctx)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> List[T]:
-        return [self.wrap(self.item._unpack(raw, ctx)) for _ in range(self.size)]
+    def _size(self) -> Optional[int]:
+        size = field_size(self.item)
+        return None if size is None else size * self.size
+
+    def _packed_size(self, value: List[T], ctx: Context) -> int:
+        return items_packed_size(self.item, value, ctx)
+
+    def _pack_into(self,
+        value: List[T], buffer: memoryview, offset: int, ctx: Context) -> int:
+        if len(value) > self.size:
+            raise OverflowError(f'length of list greater than {self.size}')
+        return pack_items_into(
+            self.item, self.array, value, buffer, offset, ctx)
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        skip_items(self.item, raw, ctx, self.size)
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> List[T]:
+        return unpack_items(
+            self.item, self.wrap, self.array, raw, ctx, self.size)
 
 class GreedyList(Field[List[T]]):
     """
     Object List Serializer of Unlimited Size
     """
-    __slots__ = ('item', 'wrap')
+    __slots__ = ('item', 'wrap', 'array')
 
-    def __init__(self, item: Union[Field[T], _AnnotatedAlias]):
+    def __init__(self,
+        item: Union[Field[T], _AnnotatedAlias], container: Container = 'list'):
         wrapper, item = deanno(item, 'GreedyList ')
         self.item: Field[T] = item
         self.wrap: Wrapper  = wrapper
+        self.array = IntArray.compile(item, wrapper, container)
 
     def __repr__(self) -> str:
         return f'GreedyList(item={self.item!r})'
 
     def _pack(self, value: List[T], ctx: Context) -> bytes:
-        return b''.join(self.item._pack(item, ctx) for item in value)
+        return pack_items(self.item, self.array, value, ctx)
+
+    def _packed_size(self, value: List[T], ctx: Context) -> int:
+        return items_packed_size(self.item, value, ctx)
+
+    def _pack_into(self,
+        value: List[T], buffer: memoryview, offset: int, ctx: Context) -> int:
+        return pack_items_into(
+            self.item, self.array, value, buffer, offset, ctx)
 
-    def _unpack(self, raw: bytes, ctx: Context) -> List[T]:
+    def _skip(self, raw: Buffer, ctx: Context):
+        ctx.index = max(ctx.index, len(raw))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> List[T]:
+        if self.array is not None:
+            size  = self.array.field.size
+            count = max(0, -(-(len(raw) - ctx.index) // size))
+            return unpack_items(
+                self.item, self.wrap, self.array, raw, ctx, count)
         items = []
         while ctx.index < len(raw):
             item = self.wrap(self.item._unpack(raw, ctx))
             items.append(item)
         return items
 
+class HintedStruct(Field[T]):
+    """
+    Nested Struct (or Field) Serializer with Prefixed Sizehint
+
+    the inner value is parsed in place within a window of the parent buffer
+    bounded by the sizehint, so greedy fields stop at the end of the window
+    and domain pointers keep resolving against the parent message. unused
+    bytes left within the window are skipped. on pack the sizehint slot is
+    reserved and back-patched once the inner value is written.
+    """
+    __slots__ = ('hint', 'item', 'wrap')
+
+    def __init__(self, hint: IntHint, item: Union[Field[T], _AnnotatedAlias]):
+        wrap, item = deanno(item, 'HintedStruct ')
+        field      = deanno_int(hint, 'HintedStruct ')[1]
+        if not isinstance(field, IntField):
+            raise TypeError(f'HintedStruct requires fixed-size hint: {hint!r}')
+        self.hint: IntField = field
+        self.item: Field[T] = item
+        self.wrap: Wrapper  = wrap
+
+    def __repr__(self) -> str:
+        return f'HintedStruct(hint={self.hint!r}, item={self.item!r})'
+
+    def _packed_size(self, value: T, ctx: Context) -> int:
+        ctx.index += self.hint.size
+        item = self.wrap(value)
+        return self.hint.size + field_packed_size(self.item, item, ctx)
+
+    def _pack(self, value: T, ctx: Context) -> bytes:
+        ctx.index += self.hint.size
+        data = self.item._pack(self.wrap(value), ctx)
+        end  = ctx.index
+        hint = self.hint._pack(len(data), ctx)
+        ctx.index = end
+        return hint + data
+
+    def _pack_into(self,
+        value: T, buffer: memoryview, offset: int, ctx: Context) -> int:
+        size: int  = self.hint.size
+        ctx.index += size
+        size      += pack_field_into(
+            self.item, self.wrap(value), buffer, offset + size, ctx)
+        end = ctx.index
+        pack_field_into(self.hint, size - self.hint.size, buffer, offset, ctx)
+        ctx.index = end
+        return size
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        size = self.hint._unpack(raw, ctx)
+        ctx.require(raw, size)
+        ctx.index += size
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> T:
+        size = self.hint._unpack(raw, ctx)
+        ctx.require(raw, size)
+        end    = ctx.index + size
+        window = raw if end == len(raw) else memoryview(raw)[:end]
+        try:
+            value = self.item._unpack(window, ctx)
+        except IncompleteError as e:
+            # window is fully buffered so missing data is malformed input
+            raise ValueError(f'{e} within window({size})') from None
+        ctx.index = end
+        return self.wrap(value)
+
 class Const(Field[bytes]):
     """
     Constant Static Bytes Assignment Field Validator
@@ -217,17 +852,96 @@ class Const(Field[bytes]):
     def __repr__(self):
         return f'Const({self.const!r})'
 
-    def _pack(self, value: bytes, ctx: Context) -> bytes:
-        if value != self.const:
-            raise ValueError(f'{value!r} does not match const {self.const!r}')
-        return ctx.track_bytes(value)
-
-    def _unpack(self, raw: bytes, ctx: Context) -> bytes:
-        value = ctx.slice(raw, len(self.const))
+    def _check(self, value: B) -> B:
         if value != self.const:
             raise ValueError(f'{value!r} does not match const {self.const!r}')
         return value
 
+    def _fmt(self) -> Optional[FixedFmt]:
+        size = len(self.const)
+        return FixedFmt(f'{size}s', size, None, bytes, self._check, self._check)
+
+    def _size(self) -> Optional[int]:
+        return len(self.const)
+
+    def _pack(self, value: bytes, ctx: Context) -> bytes:
+        return ctx.track_bytes(self._check(value))
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> bytes:
+        self._check(ctx.slice(raw, len(self.const)))
+        return self.const
+
+class Switch(Field[Any]):
+    """
+    Tagged Union Serializer Dispatching on a Prefixed Integer Tag
+
+    variants are decoded from the same context without copying the input.
+    the tag is chosen on pack from the class of the value being packed.
+    """
+    __slots__ = ('hint', 'variants', 'table', 'tags')
+
+    def __init__(self, hint: IntHint, variants: Dict[int, Any]):
+        self.hint: HintField = deanno_int(hint, 'Switch ')[1]
+        self.variants: Dict[int, Tuple[Wrapper, Field]] = {}
+        self.tags:     Dict[type, int] = {}
+        for tag, variant in variants.items():
+            wrap, field = deanno(variant, 'Switch ')
+            self.variants[tag] = (wrap, field)
+            kind = field if isinstance(field, type) else wrap
+            if isinstance(kind, type) and kind not in self.tags:
+                self.tags[kind] = tag
+        # precompute dense lookup table for small tags
+        self.table: Optional[List[Optional[Tuple[Wrapper, Field]]]] = None
+        if all(0 <= tag <= SWITCH_TABLE_MAX for tag in variants):
+            self.table = [
+                self.variants.get(n) for n in range(SWITCH_TABLE_MAX + 1)]
+
+    def __repr__(self) -> str:
+        return f'Switch(hint={self.hint!r}, variants={self.variants!r})'
+
+    def _tag(self, value: Any) -> Tuple[int, Wrapper, Field]:
+        """retrieve tag and variant of the value being packed"""
+        tag = self.tags.get(type(value))
+        if tag is None:
+            tag = next((self.tags[base] for base
+                in type(value).__mro__ if base in self.tags), None)
+            if tag is None:
+                raise ValueError(f'no switch variant for {type(value)!r}')
+        return (tag, *self.variants[tag])
+
+    def _variant(self, tag: int) -> Tuple[Wrapper, Field]:
+        """retrieve variant of the unpacked tag"""
+        if self.table is not None and 0 <= tag <= SWITCH_TABLE_MAX:
+            variant = self.table[tag]
+        else:
+            variant = self.variants.get(tag)
+        if variant is None:
+            raise ValueError(f'unknown switch tag: {tag!r}')
+        return variant
+
+    def _packed_size(self, value: Any, ctx: Context) -> int:
+        tag, wrap, field = self._tag(value)
+        size = field_packed_size(self.hint, tag, ctx)
+        return size + field_packed_size(field, wrap(value), ctx)
+
+    def _pack(self, value: Any, ctx: Context) -> bytes:
+        tag, wrap, field = self._tag(value)
+        return self.hint._pack(tag, ctx) + field._pack(wrap(value), ctx)
+
+    def _pack_into(self,
+        value: Any, buffer: memoryview, offset: int, ctx: Context) -> int:
+        tag, wrap, field = self._tag(value)
+        size  = pack_field_into(self.hint, tag, buffer, offset, ctx)
+        size += pack_field_into(field, wrap(value), buffer, offset + size, ctx)
+        return size
+
+    def _skip(self, raw: Buffer, ctx: Context):
+        skip_field(self._variant(self.hint._unpack(raw, ctx))[1], raw, ctx)
+
+    def _unpack(self, raw: Buffer, ctx: Context) -> Any:
+        wrap, field = self._variant(self.hint._unpack(raw, ctx))
+        return wrap(field._unpack(raw, ctx))
+
 #** Annotations **#
 
 I8   = Annotated[int, IntField(1, signed=True)]
@@ -243,3 +957,10 @@ U32  = Annotated[int, IntField(4, signed=False)]
 U48  = Annotated[int, IntField(6, signed=False)]
 U64  = Annotated[int, IntField(8, signed=False)]
 U128 = Annotated[int, IntField(16, signed=False)]
+
+F16 = Annotated[float, FloatField(2)]
+F32 = Annotated[float, FloatField(4)]
+F64 = Annotated[float, FloatField(8)]
+
+VarInt = Annotated[int, VarIntField()]
+ZigZag = Annotated[int, VarIntField(zigzag=True)]
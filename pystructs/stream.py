@@ -0,0 +1,303 @@
+"""
+Incremental Struct Decoding for Partial/Chunked Input
+"""
+import errno
+import os
+from mmap import ACCESS_READ, mmap
+from typing import (
+    BinaryIO, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, cast)
+
+from .abc import Buffer, Context, IncompleteError, StreamContext
+from .struct import Struct
+
+#** Variables **#
+__all__ = ['StreamDecoder', 'StructReader', 'StructWriter']
+
+#: default number of bytes read/written per buffered file operation
+BUFFER_SIZE = 1 << 20
+
+S = TypeVar('S', bound=Struct)
+
+#** Classes **#
+
+class StreamDecoder(Generic[S]):
+    """
+    Incremental Struct Decoder Fed with Arbitrarily Sized Chunks
+
+    Decoding is only retried once the number of bytes reported missing by
+    the last attempt are buffered. Size hints and blocks of fixed-size list
+    items report their full length at once, so large frames are not
+    repeatedly re-parsed as chunks arrive. Lists of variable-size items
+    still report one item at a time. Malformed input raises as usual while
+    short input only waits for more. Records completed before malformed
+    data in the same chunk are returned first and the error is raised by
+    the following call. Malformed fixed-width records are skipped so the
+    decoder may continue, while variable-width data requires a reset.
+    Greedy fields consume whatever is buffered and are unsuitable here.
+    """
+    __slots__ = ('struct', 'buffer', 'start', 'needed', 'error', 'ctx')
+
+    def __init__(self, struct: Type[S]):
+        """
+        :param struct: struct definition to decode from the stream
+        """
+        self.struct = struct
+        self.ctx    = StreamContext()
+        self.reset()
+
+    def reset(self):
+        """
+        discard all buffered data and decoding state
+        """
+        self.buffer = bytearray()
+        self.start  = 0
+        self.needed = self.struct.__prefix__ or 1
+        self.error: Optional[Exception] = None
+
+    def pending(self) -> int:
+        """
+        :return: number of buffered bytes not yet decoded
+        """
+        return len(self.buffer) - self.start
+
+    def feed(self, chunk: Buffer) -> List[S]:
+        """
+        buffer another chunk of data and decode all completed records
+
+        :param chunk: next bytes received from the stream
+        :return:      struct records completed by the new data
+        """
+        self.buffer += chunk
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        records: List[S] = []
+        try:
+            if self.struct.__size__ is not None:
+                self._decode_many(records)
+            while self.pending() >= self.needed:
+                record = self._decode()
+                if record is None:
+                    break
+                records.append(record)
+        except Exception as err:
+            if not records:
+                raise
+            self.error = err
+        finally:
+            if self.start:
+                del self.buffer[:self.start]
+                self.start = 0
+        return records
+
+    def _decode_many(self, records: List[S]):
+        """
+        decode all complete fixed-width records from pending data in bulk
+
+        falls back to decoding record by record when the bulk decode fails
+        so records before the malformed one are kept and it is skipped.
+        """
+        size  = cast(int, self.struct.__size__)
+        count = self.pending() // size
+        end   = self.start + count * size
+        try:
+            with memoryview(self.buffer) as view, view[self.start:end] as raw:
+                records.extend(self.struct.unpack_many(raw, count))
+            self.start = end
+            return
+        except Exception:
+            pass
+        ctx = self.ctx
+        while self.start < end:
+            stop = self.start + size
+            ctx.reset()
+            try:
+                with memoryview(self.buffer) as view, \
+                    view[self.start:stop] as raw:
+                    records.append(self.struct._unpack(raw, ctx))
+            finally:
+                self.start = stop
+
+    def _decode(self) -> Optional[S]:
+        """
+        attempt to decode a single record from the start of pending data
+        """
+        ctx = self.ctx
+        ctx.reset()
+        with memoryview(self.buffer) as view, view[self.start:] as raw:
+            try:
+                record = self.struct._unpack(raw, ctx)
+            except IncompleteError:
+                self.needed = max(ctx.needed, self.pending() + 1)
+                return None
+        self.start += ctx.index
+        self.needed = self.struct.__prefix__ or 1
+        return record
+
+class StructReader(Generic[S]):
+    """
+    Buffered Iterator of Back-to-Back Struct Records from a Binary File
+
+    Seekable files are memory-mapped and decoded in place while pipes and
+    sockets are consumed with large reads. Fixed-width structs are decoded
+    in bulk either way.
+    """
+    __slots__ = ('fileobj', 'struct', 'bufsize', 'use_mmap')
+
+    def __init__(self,
+        fileobj:  BinaryIO,
+        struct:   Type[S],
+        bufsize:  int  = BUFFER_SIZE,
+        use_mmap: bool = True,
+    ):
+        """
+        :param fileobj:  binary file, pipe, or raw io object to read from
+        :param struct:   struct definition of records in the file
+        :param bufsize:  number of bytes to read per read call
+        :param use_mmap: memory-map the file when it is seekable
+        """
+        self.fileobj  = fileobj
+        self.struct   = struct
+        self.bufsize  = bufsize
+        self.use_mmap = use_mmap
+
+    def __iter__(self) -> Iterator[S]:
+        fileno = self._fileno()
+        if fileno is not None:
+            return self._iter_mmap(fileno)
+        return self._iter_read()
+
+    def _fileno(self) -> Optional[int]:
+        """retrieve file descriptor of file when it can be memory-mapped"""
+        if not self.use_mmap:
+            return None
+        try:
+            if not self.fileobj.seekable():
+                return None
+            fileno = self.fileobj.fileno()
+            offset = self.fileobj.tell()
+        except (AttributeError, OSError):
+            return None
+        return fileno if os.fstat(fileno).st_size > offset else None
+
+    def _iter_read(self) -> Iterator[S]:
+        """iterate records using large buffered reads"""
+        decoder = StreamDecoder(self.struct)
+        while True:
+            chunk = self.fileobj.read(self.bufsize)
+            if not chunk:
+                break
+            yield from decoder.feed(chunk)
+        if decoder.pending():
+            raise IncompleteError(
+                f'truncated record: {decoder.pending()} trailing bytes')
+
+    def _iter_mmap(self, fileno: int) -> Iterator[S]:
+        """iterate records decoded directly from a memory-mapped file"""
+        offset = self.fileobj.tell()
+        size   = self.struct.__size__
+        with mmap(fileno, 0, access=ACCESS_READ) as mm:
+            end = len(mm)
+            try:
+                if size is not None:
+                    batch = max(1, self.bufsize // max(size, 1))
+                    while offset + size <= end:
+                        count = min(batch, (end - offset) // size)
+                        stop  = offset + count * size
+                        with memoryview(mm)[offset:stop] as raw:
+                            records = self.struct.unpack_many(raw, count)
+                        offset = stop
+                        yield from records
+                else:
+                    ctx = StreamContext()
+                    while offset < end:
+                        ctx.reset()
+                        try:
+                            with memoryview(mm)[offset:] as raw:
+                                record = self.struct._unpack(raw, ctx)
+                        except IncompleteError:
+                            break
+                        offset += ctx.index
+                        yield record
+            finally:
+                self.fileobj.seek(offset)
+        if offset < end:
+            raise IncompleteError(
+                f'truncated record: {end - offset} trailing bytes')
+
+class StructWriter:
+    """
+    Buffered Writer Batching Many Packed Struct Records per Write Call
+
+    Records are accumulated in memory and written with a single call once
+    the buffer fills (and on flush, close or exit), rather than one write
+    per record. Exiting the context only flushes and leaves the file open.
+    """
+    __slots__ = ('fileobj', 'bufsize', 'buffer', 'ctx')
+
+    def __init__(self, fileobj: BinaryIO, bufsize: int = BUFFER_SIZE):
+        """
+        :param fileobj: binary file, pipe, or raw io object to write to
+        :param bufsize: number of buffered bytes that triggers a write
+        """
+        self.fileobj = fileobj
+        self.bufsize = bufsize
+        self.buffer  = bytearray()
+        self.ctx     = Context()
+
+    def __enter__(self) -> 'StructWriter':
+        return self
+
+    def __exit__(self, *_):
+        self.flush()
+
+    def write(self, record: Struct):
+        """
+        pack and buffer a single struct record
+
+        :param record: struct record to write
+        """
+        self.ctx.reset()
+        self.buffer += record.pack(self.ctx)
+        if len(self.buffer) >= self.bufsize:
+            self.flush()
+
+    def write_many(self, records: Iterable[Struct]):
+        """
+        pack and buffer many struct records
+
+        :param records: struct records to write
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """
+        write all buffered records to the underlying file
+
+        bytes that could not be written remain buffered when the file
+        would block or stops accepting data.
+        """
+        written = 0
+        try:
+            with memoryview(self.buffer) as view:
+                while written < len(view):
+                    with view[written:] as chunk:
+                        count = self.fileobj.write(chunk)
+                    if count is None:
+                        raise BlockingIOError(
+                            errno.EAGAIN, 'write would block', written)
+                    if count == 0:
+                        raise OSError('write returned 0 bytes')
+                    written += count
+        finally:
+            del self.buffer[:written]
+
+    def close(self):
+        """
+        flush remaining records and close the underlying file
+        """
+        try:
+            self.flush()
+        finally:
+            self.fileobj.close()
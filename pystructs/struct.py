@@ -1,15 +1,30 @@
 """
 Serializer Struct Object Definition
 """
-from typing import Any, Optional, Type, cast
-from typing_extensions import Self, dataclass_transform
+import os
+from itertools import takewhile
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterable, Iterator, List,
+    Optional, Sequence, Tuple, Type, Union, cast)
+from typing_extensions import Self, dataclass_transform, get_args
 
 from pyderive import BaseField, dataclass, fields, gen_slots
 
-from .abc import Context, Field, Wrapper, deanno
+from .abc import IDENTITY, Buffer, Context, Field, Wrapper, deanno
+from .abc import IncompleteError, StreamContext
+from .abc import field_size, pack_field_into, writable
+from .codec import (
+    FieldStep, FixedRun, codegen_pack, codegen_unpack, compile_steps,
+    field_steps, pack_steps, pack_steps_into, packed_size_steps, skip_steps,
+    unpack_steps)
+from .std import ColumnContainer
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader, StreamWriter
 
 #** Variables **#
-__all__ = ['Struct', 'StructField', 'field']
+__all__ = ['Struct', 'StructField', 'StructView', 'field', 'pack_sequence']
 
 #: tracker of already compiled struct instances
 COMPILED = set()
@@ -25,22 +40,112 @@ def field(**kwargs) -> Any:
     """
     return StructField(**kwargs)
 
-def _compile(cls, slots: bool = True, **kwargs):
+def pack_sequence(values: Iterable['Struct'],
+    ctx: Optional[Context] = None, index: Optional[List[int]] = None) -> bytes:
+    """
+    pack back-to-back struct records of any type into a single buffer
+
+    records share the same context so domain compression spans the batch.
+
+    :param values: struct records to pack in order
+    :param ctx:    serialization tracker for packaging multiple objects
+    :param index:  list to append the start offset of every record into
+    :return:       packed bytes
+    """
+    ctx    = ctx or Context()
+    buffer = bytearray()
+    for value in values:
+        if index is not None:
+            index.append(len(buffer))
+        buffer += value._pack(value, ctx)
+    return bytes(buffer)
+
+def _getter(names: Sequence[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    """generate fast attribute getter returning a tuple of field values"""
+    if len(names) == 1:
+        name = names[0]
+        return lambda value: (getattr(value, name), )
+    if not names:
+        return lambda _: ()
+    return attrgetter(*names)
+
+def _prefix(sfields: Sequence['StructField'],
+    sizes: Sequence[Optional[int]]) -> int:
+    """calculate minimum encoded size up to the first length hint's value"""
+    static = list(takewhile(lambda n: n is not None, sizes))
+    prefix = sum(static) #type: ignore
+    if len(static) < len(sfields):
+        hint    = getattr(sfields[len(static)].field, 'hint', None)
+        prefix += (field_size(hint) or 0) if hint is not None else 0
+    return prefix
+
+def _offsets(sizes: Sequence[Optional[int]]) -> Tuple[Optional[int], ...]:
+    """calculate static field offsets up until the first variable field"""
+    offsets: List[Optional[int]] = [0]
+    for size in sizes:
+        last = offsets[-1]
+        offsets.append(None if last is None or size is None else last + size)
+    return tuple(offsets)
+
+def _compile(cls,
+    slots:   bool           = True,
+    codegen: Optional[bool] = None,
+    trusted: Optional[bool] = None,
+    **kwargs,
+):
     """compile uncompiled structs"""
     global COMPILED
     if cls in COMPILED:
         return
     COMPILED.add(cls)
+    inherited = getattr(cls, '__codegen__') or getattr(cls, '__trusted__')
+    codegen   = getattr(cls, '__codegen__') if codegen is None else codegen
+    trusted   = getattr(cls, '__trusted__') if trusted is None else trusted
     dataclass(cls, field=StructField, **kwargs)
     if slots:
         setattr(cls, '__slots__', gen_slots(cls, fields(cls)))
+    # precompile serialization steps for struct fields
+    sfields = [cast(StructField, f) for f in fields(cls)]
+    names   = [f.name for f in sfields]
+    items   = [(f'{cls.__name__}.{f.name}', f.wrap, cast(Field, f.field))
+        for f in sfields]
+    use_kw  = any(f.kw_only or not f.init for f in sfields)
+    sizes   = [field_size(field) for _, _, field in items]
+    steps   = compile_steps(items)
+    record  = steps[0] if len(steps) == 1 \
+        and isinstance(steps[0], FixedRun) else None
+    setattr(cls, '__steps__', steps) #type: ignore
+    setattr(cls, '__record__', record)
+    setattr(cls, '__getter__', _getter(names))
+    setattr(cls, '__kwnames__', tuple(names) if use_kw else None)
+    setattr(cls, '__codegen__', codegen)
+    setattr(cls, '__trusted__', trusted)
+    setattr(cls, '__size__', None if None in sizes else sum(sizes))
+    setattr(cls, '__prefix__', _prefix(sfields, sizes))
+    setattr(cls, '__offsets__', _offsets(sizes))
+    setattr(cls, '__indexes__', {name: n for n, name in enumerate(names, 0)})
+    setattr(cls, '__layout__', tuple(field_steps(steps)))
+    # generate specialized pack/unpack functions or restore generic ones
+    # trusted structs re-run the generic functions only to annotate errors
+    for name in ('_pack', '_unpack'):
+        if name in cls.__dict__ or not (codegen or trusted or inherited):
+            continue
+        generic = Struct.__dict__[name].__func__
+        checked = generic if trusted else None
+        if (codegen or trusted) and name == '_pack':
+            func = codegen_pack(cls.__steps__, names, cls.__getter__, checked)
+        elif codegen or trusted:
+            func = codegen_unpack(cls.__steps__, names, use_kw, checked)
+        else:
+            func = generic
+        setattr(cls, name, classmethod(func))
 
 #** Classes **#
 
 @dataclass
 class StructField(BaseField):
     field: Optional[Field] = None
-    wrap:  Wrapper         = lambda x: x
+    wrap:  Wrapper         = IDENTITY
 
     def __compile__(self, cls: Type):
         """ensure serialization field/wrapper is present"""
@@ -54,35 +159,72 @@ class Struct(Field):
     """
     Collection of Serialization Fields to Pack/Unpack
     """
+    __steps__   = ()
+    __getter__  = staticmethod(lambda _: ())
+    __kwnames__ = None
+    __codegen__ = False
+    __trusted__ = False
+    __prefix__  = 0
+    __offsets__ = (0, )
+
+    __size__:    ClassVar[Optional[int]]         = None
+    __indexes__: ClassVar[Dict[str, int]]        = {}
+    __layout__:  ClassVar[Tuple[FieldStep, ...]] = ()
+    __record__:  ClassVar[Optional[FixedRun]]    = None
 
     def __init_subclass__(cls, **kwargs):
         _compile(cls, **kwargs)
 
     @classmethod
     def _pack(cls, value: Self, ctx: Context) -> bytes: #type: ignore
-        raw = bytearray()
-        for f in fields(cls):
-            field = cast(StructField, f)
-            wrap  = cast(Wrapper, field.wrap)
-            try:
-                val  = wrap(getattr(value, f.name))
-                raw += cast(Field, field.field)._pack(val, ctx)
-            except (ValueError, OverflowError) as e:
-                raise e.__class__(f'{cls.__name__}.{f.name}->{e}') from None
-        return bytes(raw)
-
-    @classmethod
-    def _unpack(cls, raw: bytes, ctx: Context) -> Self: #type: ignore
-        kwargs = {}
-        for f in fields(cls):
-            field = cast(StructField, f)
-            wrap  = cast(Wrapper, field.wrap)
-            try:
-                value = cast(Field, field.field)._unpack(raw, ctx)
-                kwargs[f.name] = wrap(value)
-            except (ValueError, OverflowError) as e:
-                raise e.__class__(f'{cls.__name__}.{f.name}->{e}') from None
-        return cls(**kwargs)
+        return pack_steps(cls.__steps__, cls.__getter__(value), ctx)
+
+    @classmethod
+    def _size(cls) -> Optional[int]:
+        return cls.__size__
+
+    @classmethod
+    def _packed_size(cls, value: Self, ctx: Context) -> int:
+        values = cls.__getter__(value)
+        return packed_size_steps(cls.__steps__, values, ctx)
+
+    @classmethod
+    def _pack_into(cls, value: Self,
+        buffer: memoryview, offset: int, ctx: Context) -> int:
+        values = cls.__getter__(value)
+        return pack_steps_into(cls.__steps__, values, buffer, offset, ctx)
+
+    @classmethod
+    def _unpack(cls, raw: Buffer, ctx: Context) -> Self: #type: ignore
+        return cls._construct(unpack_steps(cls.__steps__, raw, ctx))
+
+    @classmethod
+    def _skip(cls, raw: Buffer, ctx: Context):
+        if cls.__size__ is None:
+            return skip_steps(cls.__steps__, raw, ctx)
+        ctx.require(raw, cls.__size__)
+        ctx.index += cls.__size__
+
+    @classmethod
+    def calcsize(cls) -> int:
+        """
+        retrieve the static encoded size of a fixed-width struct
+
+        :return: encoded size in bytes
+        """
+        if cls.__size__ is None:
+            raise TypeError(f'{cls.__name__} is not a fixed-width struct')
+        return cls.__size__
+
+    def packed_size(self, ctx: Optional[Context] = None) -> int:
+        """
+        calculate encoded size of struct without serializing it
+
+        :param ctx: serialization tracker for packaging multiple objects
+        :return:    encoded size in bytes
+        """
+        ctx = ctx or Context()
+        return self._packed_size(self, ctx)
 
     def pack(self, ctx: Optional[Context] = None) -> bytes:
         """
@@ -94,14 +236,331 @@ class Struct(Field):
         ctx = ctx or Context()
         return self._pack(self, ctx)
 
+    def pack_into(self,
+        buffer: Buffer, offset: int = 0, ctx: Optional[Context] = None) -> int:
+        """
+        pack struct fields directly into a preallocated writable buffer
+
+        :param buffer: bytearray, memoryview, mmap, etc. to write into
+        :param offset: offset within buffer to start writing
+        :param ctx:    serialization tracker for packaging multiple objects
+        :return:       number of bytes written
+        """
+        ctx = ctx or Context()
+        return self._pack_into(self, writable(buffer), offset, ctx)
+
+    @classmethod
+    def pack_many(cls, values: Sequence[Self],
+        ctx: Optional[Context] = None, index: Optional[List[int]] = None,
+    ) -> bytes:
+        """
+        pack back-to-back struct records into a single buffer
+
+        flat fixed-width structs are written directly into one preallocated
+        buffer rather than allocating bytes for every record.
+
+        :param values: struct records to pack in order
+        :param ctx:    serialization tracker for packaging multiple objects
+        :param index:  list to append the start offset of every record into
+        :return:       packed bytes
+        """
+        ctx    = ctx or Context()
+        record = cls.__record__
+        if record is None or any(type(value) is not cls for value in values):
+            return pack_sequence(values, ctx, index)
+        size   = record.size
+        buffer = bytearray(size * len(values))
+        getter = cls.__getter__
+        with memoryview(buffer) as view:
+            for offset, value in zip(range(0, len(buffer), size), values):
+                record.pack_into(getter(value), view, offset, ctx)
+        if index is not None:
+            index.extend(range(0, len(buffer), size))
+        return bytes(buffer)
+
     @classmethod
-    def unpack(cls, raw: bytes, ctx: Optional[Context] = None) -> Self:
+    def _construct(cls, values: Sequence[Any]) -> Self:
+        """construct struct instance from field values"""
+        if cls.__kwnames__ is not None:
+            return cls(**dict(zip(cls.__kwnames__, values)))
+        return cls(*values)
+
+    @classmethod
+    def unpack_many(cls, raw: Buffer, count: Optional[int] = None,
+        ctx: Optional[Context] = None, zero_copy: bool = False) -> List[Self]:
+        """
+        unpack back-to-back struct records from encoded bytes
+
+        flat fixed-width structs are decoded in bulk with a single
+        `struct.iter_unpack` call rather than one call per record.
+
+        :param raw:       raw encoded bytes (or any buffer object) to unpack
+        :param count:     number of records to unpack (until end of buffer)
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
+        :return:          list of unpacked struct objects
+        """
+        ctx   = ctx or Context()
+        saved = ctx.zero_copy
+        ctx.zero_copy = saved or zero_copy
+        try:
+            raw   = ctx.buffer(raw)
+            items: List[Self] = []
+            if cls.__record__ is not None:
+                rows  = cls.__record__.unpack_rows(raw, ctx, count)
+                items = [cls._construct(row) for row in rows]
+            while True:
+                if count is None and ctx.index >= len(raw):
+                    break
+                if count is not None and len(items) >= count:
+                    break
+                items.append(cls._unpack(raw, ctx))
+            return items
+        finally:
+            ctx.zero_copy = saved
+
+    @classmethod
+    def unpack_columns(cls, raw: Buffer, count: Optional[int] = None,
+        container: ColumnContainer = 'array') -> Dict[str, Any]:
+        """
+        unpack back-to-back flat fixed-width struct records into columns
+
+        integer, single and double float fields are returned as `array.array`
+        columns (or numpy arrays using a structured dtype view over the
+        buffer) while other fields are decoded into lists (or raw bytes
+        columns with numpy).
+
+        :param raw:       raw encoded bytes (or any buffer object) to unpack
+        :param count:     number of records to unpack (until end of buffer)
+        :param container: column container type (array or numpy)
+        :return:          dictionary of field-name to column of values
+        """
+        if container not in get_args(ColumnContainer):
+            raise ValueError(f'unsupported column container: {container!r}')
+        if cls.__record__ is None:
+            raise TypeError(f'{cls.__name__} is not a flat fixed-width struct')
+        view  = Context(zero_copy=True).buffer(raw)
+        size  = cls.__record__.size
+        total = len(view) // size if count is None else count
+        if total * size > len(view):
+            raise ValueError(f'too little data to unpack records({total})')
+        if count is None and len(view) % size:
+            raise ValueError(f'trailing data after {total} records({size})')
+        view    = view[:total * size]
+        names   = [f.name for f in fields(cls)]
+        columns = cls.__record__.unpack_columns(view, total, container)
+        return dict(zip(names, columns))
+
+    @classmethod
+    def unpack_file(cls, path: Union[str, 'os.PathLike'],
+        workers: Optional[int]             = None,
+        columns: Optional[ColumnContainer] = None,
+    ) -> Union[Iterator[Self], Dict[str, Any]]:
+        """
+        decode a file of back-to-back records across worker processes
+
+        :param path:    path of file to decode
+        :param workers: number of worker processes (defaults to cpu count)
+        :param columns: return joined columns of this container type instead
+        :return:        ordered iterator of records (or dictionary of columns)
+        """
+        from .parallel import unpack_file
+        return unpack_file(cls, path, workers, columns)
+
+    @classmethod
+    def unpack_parallel(cls, raw: Buffer,
+        workers: Optional[int]             = None,
+        columns: Optional[ColumnContainer] = None,
+    ) -> Union[Iterator[Self], Dict[str, Any]]:
+        """
+        decode a buffer of back-to-back records across worker processes
+
+        :param raw:     raw encoded bytes (or any buffer object) to decode
+        :param workers: number of worker processes (defaults to cpu count)
+        :param columns: return joined columns of this container type instead
+        :return:        ordered iterator of records (or dictionary of columns)
+        """
+        from .parallel import unpack_parallel
+        return unpack_parallel(cls, raw, workers, columns)
+
+    @classmethod
+    async def aread(cls, reader: 'StreamReader') -> Self:
+        """
+        read and unpack a single struct from an asyncio stream
+
+        reads the static prefix of the struct first and then only as many
+        bytes as length hints demand, usually one `readexactly` per variable
+        field. greedy fields cannot be framed and only see the bytes read.
+
+        :param reader: asyncio stream to read encoded struct from
+        :return:       unpacked struct object
+        """
+        ctx  = StreamContext()
+        data = await reader.readexactly(cls.__prefix__) \
+            if cls.__prefix__ else b''
+        while True:
+            try:
+                return cls._unpack(data, ctx)
+            except IncompleteError:
+                data += await reader.readexactly(ctx.needed - len(data))
+                ctx.reset()
+
+    async def awrite(self,
+        writer: 'StreamWriter', ctx: Optional[Context] = None):
+        """
+        pack struct and write it to an asyncio stream
+
+        :param writer: asyncio stream to write encoded struct to
+        :param ctx:    serialization tracker for packaging multiple objects
+        """
+        writer.write(self.pack(ctx))
+        await writer.drain()
+
+    @classmethod
+    def view(cls, raw: Buffer,
+        ctx: Optional[Context] = None, zero_copy: bool = False) -> 'StructView':
+        """
+        create lazy view decoding struct fields only when accessed
+
+        :param raw:       raw encoded bytes (or any buffer object) to view
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
+        :return:          lazy struct view
+        """
+        return StructView(cls, raw, ctx, zero_copy)
+
+    @classmethod
+    def unpack(cls, raw: Buffer,
+        ctx: Optional[Context] = None, zero_copy: bool = False) -> Self:
         """
         unpack struct fields from encoded bytes
 
-        :param raw: raw encoded bytes to unpack
-        :param ctx: deserialization tracker for packaging multiple objects
-        :return:    unpacked struct object
+        :param raw:       raw encoded bytes (or any buffer object) to unpack
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
+        :return:          unpacked struct object
+        """
+        ctx   = ctx or Context()
+        saved = ctx.zero_copy
+        ctx.zero_copy = saved or zero_copy
+        try:
+            return cls._unpack(ctx.buffer(raw), ctx)
+        finally:
+            ctx.zero_copy = saved
+
+class StructView:
+    """
+    Lazy Struct Proxy Decoding Fields Only When Accessed
+
+    field offsets are precomputed for leading fixed-width fields and
+    discovered for later fields by skipping preceding values using their
+    size hints. decoded values are cached on first access. domain pointers
+    only resolve names already decoded or skipped through the same view.
+
+    views over writable buffers (bytearray, memoryview, mmap, etc.) also
+    support assigning fixed-width fields, encoding just that field in place.
+    """
+    __slots__ = (
+        '_struct', '_raw', '_ctx', '_zero_copy',
+        '_start', '_offsets', '_values')
+
+    def __init__(self, struct: Type[Struct], raw: Buffer,
+        ctx: Optional[Context] = None, zero_copy: bool = False):
+        """
+        :param struct:    struct definition to view raw bytes as
+        :param raw:       raw encoded bytes (or any buffer object) to view
+        :param ctx:       deserialization tracker for packaging multiple objects
+        :param zero_copy: return memoryview slices rather than copied bytes
         """
         ctx = ctx or Context()
-        return cls._unpack(raw, ctx)
+        self._struct    = struct
+        self._ctx       = ctx
+        self._zero_copy = ctx.zero_copy or zero_copy
+        self._raw       = Context(zero_copy=self._zero_copy).buffer(raw)
+        self._start     = ctx.index
+        self._offsets: List[Optional[int]] = [
+            None if offset is None else self._start + offset
+            for offset in struct.__offsets__]
+        self._values: Dict[int, Any] = {}
+
+    def __repr__(self) -> str:
+        return f'{self._struct.__name__}View({len(self._values)} decoded)'
+
+    def __getattr__(self, name: str) -> Any:
+        index = self._struct.__indexes__.get(name)
+        if index is None:
+            raise AttributeError(
+                f'{self._struct.__name__!r} has no attribute {name!r}')
+        return self._decode(index)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in StructView.__slots__:
+            return object.__setattr__(self, name, value)
+        index = self._struct.__indexes__.get(name)
+        if index is None:
+            raise AttributeError(
+                f'{self._struct.__name__!r} has no attribute {name!r}')
+        self._encode(index, value)
+
+    def _offset(self, index: int) -> int:
+        """find offset of field by skipping preceding field values"""
+        offsets = self._offsets
+        known   = index
+        while offsets[known] is None:
+            known -= 1
+        ctx   = self._ctx
+        steps = self._struct.__layout__
+        for n in range(known, index):
+            ctx.index = cast(int, offsets[n])
+            steps[n].skip(self._raw, ctx)
+            offsets[n + 1] = ctx.index
+        return cast(int, offsets[index])
+
+    def _decode(self, index: int) -> Any:
+        """decode and cache field value at index"""
+        if index in self._values:
+            return self._values[index]
+        values: List[Any] = []
+        step      = self._struct.__layout__[index]
+        ctx       = self._ctx
+        ctx.index = self._offset(index)
+        saved     = ctx.zero_copy
+        ctx.zero_copy = self._zero_copy
+        try:
+            step.unpack(self._raw, ctx, values)
+        finally:
+            ctx.zero_copy = saved
+        self._offsets[index + 1] = ctx.index
+        self._values[index]      = values[0]
+        return values[0]
+
+    def _encode(self, index: int, value: Any):
+        """encode fixed-width field value in place at its offset"""
+        step = self._struct.__layout__[index]
+        if field_size(step.field) is None:
+            raise TypeError(f'cannot assign variable-width field {step.label}')
+        buffer    = writable(self._raw)
+        ctx       = self._ctx
+        offset    = self._offset(index)
+        ctx.index = offset
+        try:
+            pack_field_into(step.field, step.wrap(value), buffer, offset, ctx)
+        except (ValueError, OverflowError) as e:
+            raise e.__class__(f'{step.label}->{e}') from None
+        self._values.pop(index, None)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        total encoded size of the viewed struct
+        """
+        return self._offset(len(self._offsets) - 1) - self._start
+
+    def unpack(self) -> Struct:
+        """
+        decode all remaining fields into a complete struct instance
+
+        :return: unpacked struct object
+        """
+        count = len(self._offsets) - 1
+        return self._struct._construct([self._decode(n) for n in range(count)])
@@ -3,9 +3,15 @@ PyStructs UnitTests
 """
 
 #** Variables **#
-__all__ = ['NetSerializerTests', 'StdSerializerTests', 'StructTests']
+__all__ = [
+    'NetSerializerTests',
+    'StdSerializerTests',
+    'StreamTests',
+    'StructTests',
+]
 
 #** Imports **#
 from .net import NetSerializerTests
 from .std import StdSerializerTests
+from .stream import StreamTests
 from .struct import StructTests
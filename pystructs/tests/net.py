@@ -71,3 +71,94 @@ class NetSerializerTests(unittest.TestCase):
         repacked = domain._pack(unpacked, self.ctx)
         self.assertEqual(unpacked, value)
         self.assertEqual(packed, repacked)
+
+    def test_domain_compression(self):
+        """
+        ensure domain suffixes are compressed into pointers when possible
+        """
+        names  = [b'www.example.com', b'mail.example.com', b'example.com.']
+        domain = DomainField()
+        ctx    = Context()
+        packed = b''.join(domain._pack(name, ctx) for name in names)
+        self.assertEqual(packed, (
+            b'\x03www\x07example\x03com\x00'
+            b'\x04mail\xc0\x04'
+            b'\xc0\x04'
+        ))
+        self.assertEqual(ctx.domain_to_index[b'example.com'], 4)
+        ctx    = Context()
+        values = [domain._unpack(packed, ctx) for _ in names]
+        self.assertEqual(values, [name.rstrip(b'.') for name in names])
+        self.assertEqual(ctx.index_to_domain[17], b'mail.example.com')
+        # offsets beyond the 14-bit pointer range are never saved
+        ctx = Context(index=0x3FFF)
+        self.assertEqual(domain._pack(b'a.com', ctx), b'\x01a\x03com\x00')
+        self.assertEqual(domain._pack(b'b.com', ctx), b'\x01b\x03com\x00')
+        self.assertEqual(ctx.domain_to_index, {b'a.com': 0x3FFF})
+
+    def test_domain_pointers(self):
+        """
+        ensure domain pointers are followed safely with typed errors
+        """
+        follow = DomainField(follow=True)
+        table  = DomainField()
+        # forward pointer and pointer into the middle of a name
+        raw = b'\x01a\xc0\x04\x01b\x03com\x00'
+        self.assertEqual(follow._unpack(raw, self.ctx), b'a.b.com')
+        self.assertRaises(DomainPointerError, table._unpack, raw, self.ctx)
+        raw = b'\x01b\x03com\x00\x01a\xc0\x02'
+        ctx = Context(index=7)
+        self.assertEqual(follow._unpack(raw, ctx), b'a.com')
+        self.assertEqual(ctx.index, len(raw))
+        # pointer loops and out of bounds pointers
+        loop = b'\x01a\xc0\x00'
+        self.assertRaises(DomainError, follow._unpack, loop, self.ctx)
+        self.assertRaises(DomainError, table._unpack, loop, self.ctx)
+        self.assertRaises(DomainPointerError,
+            follow._unpack, b'\xc0\x00', self.ctx)
+        self.assertRaises(DomainPointerError,
+            follow._unpack, b'\x01a\xc0\xff', self.ctx)
+        # label types and length limits
+        self.assertRaises(DomainLengthError,
+            follow._unpack, b'\x40' + b'a' * 64 + b'\x00', self.ctx)
+        long = b'\x3f' + b'a' * 63
+        self.assertRaises(DomainLengthError,
+            follow._unpack, long * 4 + b'\x00', self.ctx)
+        self.assertRaises(DomainLengthError,
+            table._pack, b'a' * 64 + b'.com', self.ctx)
+        self.assertRaises(DomainLengthError,
+            table._pack, b'.'.join([b'a' * 63] * 4), self.ctx)
+        # truncated names raise value errors rather than index errors
+        self.assertRaises(ValueError, table._unpack, b'\x01a', self.ctx)
+        self.assertRaises(ValueError, follow._unpack, b'\x01a\xc0', self.ctx)
+
+    def test_context_lazy(self):
+        """
+        ensure domain tables are only allocated when domains are used
+        """
+        ctx = Context()
+        unpack((U8, IPv4), pack((U8, IPv4), 1, IPv4Address('1.2.3.4'), ctx=ctx))
+        self.assertIsNone(ctx.domain_suffixes)
+        self.assertIsNone(ctx.domain_labels)
+        self.assertEqual(ctx.index_to_domain, {})
+        packed = pack((Domain, ), b'example.com', ctx=ctx)
+        self.assertEqual(ctx.domain_to_index, {
+            b'example.com': 5, b'com': 13})
+        ctx.reset()
+        self.assertEqual(ctx.domain_to_index, {})
+        self.assertEqual(unpack((Domain, ), packed, ctx), (b'example.com', ))
+        self.assertEqual(ctx.index_to_domain, {0: b'example.com', 8: b'com'})
+
+    def test_save_domain(self):
+        """
+        ensure manually saved domains are used for compression and lookup
+        """
+        ctx = Context()
+        ctx.save_domain(b'example.com', 12)
+        self.assertEqual(ctx.index, 0)
+        self.assertEqual(ctx.domain_to_index, {
+            b'example.com': 12, b'com': 20})
+        self.assertEqual(ctx.index_to_domain, {
+            12: b'example.com', 20: b'com'})
+        self.assertEqual(pack((Domain, ), b'www.example.com', ctx=ctx),
+            b'\x03www\xc0\x0c')
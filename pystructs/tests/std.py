@@ -3,7 +3,10 @@ PyStructs Standard Serializer Field UnitTests
 """
 import random
 import unittest
+from array import array
+from importlib.util import find_spec
 from typing import List
+from typing_extensions import Annotated
 
 from .. import *
 
@@ -171,3 +174,154 @@ class StdSerializerTests(unittest.TestCase):
         self.assertRaises(ValueError, const._pack, b'hell', self.ctx)
         self.assertRaises(ValueError, const._unpack, b'hell', self.ctx)
 
+    def test_float(self):
+        """
+        ensure float fields pack/unpack correctly and merge into runs
+        """
+        for size, value in ((2, 0.5), (4, 1.25), (8, 1e300)):
+            for format in ('big', 'little'):
+                with self.subTest(size=size, format=format):
+                    codec    = FloatField(size, format)
+                    packed   = codec._pack(value, self.ctx)
+                    unpacked = codec._unpack(packed, self.ctx)
+                    self.assertEqual(len(packed), size)
+                    self.assertEqual(unpacked, value)
+                    self.assertRaises(
+                        ValueError, codec._unpack, packed[1:], self.ctx)
+        self.assertRaises(OverflowError, FloatField(4)._pack, 1e300, self.ctx)
+        packed = pack((U8, F32, F64), 1, 2.0, 3.0)
+        self.assertEqual(packed, b'\x01@\x00\x00\x00@\x08' + bytes(6))
+        self.assertEqual(unpack((U8, F32, F64), packed), (1, 2.0, 3.0))
+
+    def test_varint(self):
+        """
+        ensure varint/zigzag fields pack/unpack correctly
+        """
+        varint, zigzag = VarIntField(), VarIntField(zigzag=True)
+        for value, raw in ((0, b'\x00'), (1, b'\x01'),
+            (127, b'\x7f'), (128, b'\x80\x01'), (300, b'\xac\x02')):
+            with self.subTest(value=value):
+                ctx = Context()
+                self.assertEqual(varint._pack(value, self.ctx), raw)
+                self.assertEqual(varint._unpack(raw, ctx), value)
+                self.assertEqual(ctx.index, len(raw))
+        for value, raw in ((0, b'\x00'), (-1, b'\x01'), (1, b'\x02'),
+            (-64, b'\x7f'), (64, b'\x80\x01'), (-2**63, b'\xff' * 9 + b'\x01')):
+            with self.subTest(value=value):
+                self.assertEqual(zigzag._pack(value, self.ctx), raw)
+                self.assertEqual(zigzag._unpack(raw, self.ctx), value)
+        self.assertRaises(OverflowError, varint._pack, -1, self.ctx)
+        self.assertRaises(OverflowError, varint._pack, 2**64, self.ctx)
+        self.assertRaises(OverflowError, zigzag._pack, 2**63, self.ctx)
+        with self.assertRaisesRegex(ValueError, 'unpack varint'):
+            varint._unpack(b'\x80', Context())
+        stream = StreamContext()
+        self.assertRaises(IncompleteError, varint._unpack, b'\x80', stream)
+        self.assertEqual(stream.needed, 2)
+        self.assertRaises(ValueError, varint._unpack, b'\xff' * 11, self.ctx)
+        self.assertRaises(
+            ValueError, varint._unpack, b'\xff' * 9 + b'\x7f', self.ctx)
+
+    def test_varint_hint(self):
+        """
+        ensure varints may be used as size-hints for bytes and lists
+        """
+        value  = b'x' * 200
+        hinted = HintedBytes(VarInt)
+        packed = hinted._pack(value, self.ctx)
+        self.assertEqual(packed[:2], b'\xc8\x01')
+        self.assertEqual(hinted._unpack(packed, self.ctx), value)
+        items  = HintedList(VarInt, ZigZag)
+        packed = items._pack([-1, 0, 1], self.ctx)
+        self.assertEqual(packed, b'\x03\x01\x00\x02')
+        self.assertEqual(items._unpack(packed, self.ctx), [-1, 0, 1])
+        self.assertRaises(TypeError, HintedBytes, F32)
+
+    def test_bitstruct(self):
+        """
+        ensure bit-struct packs/unpacks sub-fields within a single word
+        """
+        flags = BitStruct(U16,
+            qr=1, opcode=4, aa=1, tc=1, rd=1, ra=1, z=3, rcode=4)
+        value = BitFields(qr=1, rd=1, rcode=3)
+        packed = flags._pack(value, self.ctx)
+        self.assertEqual(packed, b'\x81\x03')
+        self.assertEqual(flags._pack({'qr': 1, 'rd': 1, 'rcode': 3},
+            self.ctx), packed)
+        unpacked = flags._unpack(packed, self.ctx)
+        self.assertEqual(unpacked.asdict(), {'qr': 1, 'opcode': 0,
+            'aa': 0, 'tc': 0, 'rd': 1, 'ra': 0, 'z': 0, 'rcode': 3})
+        self.assertEqual(BitFields(unpacked), unpacked)
+        self.assertEqual(pack((U8, flags), 1, value), b'\x01' + packed)
+        self.assertEqual(unpack((U8, flags), b'\x01' + packed)[1], unpacked)
+        self.assertRaises(OverflowError, flags._pack, {'rcode': 16}, self.ctx)
+        self.assertRaises(TypeError, BitStruct, I16, a=1)
+        self.assertRaises(ValueError, BitStruct, U8, a=4, b=5)
+        buffer = bytearray(b'\x00' + packed)
+        flags.update_into(buffer, 1, aa=1, rcode=0)
+        self.assertEqual(buffer, b'\x00\x85\x00')
+        self.assertRaises(TypeError, flags.update_into, buffer, 1, nope=1)
+        self.assertRaises(OverflowError, flags.update_into, buffer, 1, qr=2)
+
+    def test_zero_copy(self):
+        """
+        ensure bytes fields return memoryview slices in zero-copy mode
+        """
+        raw = bytearray(b'\x03abcstatic\x00\x00greedy')
+        ctx = Context(zero_copy=True)
+        hinted = HintedBytes(U8)._unpack(raw, ctx)
+        static = StaticBytes(8)._unpack(raw, ctx)
+        greedy = GreedyBytes()._unpack(raw, ctx)
+        for value, expected in ((hinted, b'abc'),
+            (static, b'static'), (greedy, b'greedy')):
+            self.assertIsInstance(value, memoryview)
+            self.assertEqual(bytes(value), expected)
+        raw[1:4] = b'xyz'
+        self.assertEqual(bytes(hinted), b'xyz')
+
+    def test_buffer_inputs(self):
+        """
+        ensure fields unpack from any buffer-protocol object as bytes
+        """
+        raw = b'\x03abcstatic\x00\x00'
+        for buffer in (raw, bytearray(raw), memoryview(raw)):
+            with self.subTest(buffer=type(buffer).__name__):
+                values = unpack((HintedBytes(U8), StaticBytes(8)), buffer)
+                self.assertEqual(values, (b'abc', b'static'))
+                self.assertIsInstance(values[0], bytes)
+
+    def test_list_bulk(self):
+        """
+        ensure integer lists pack/unpack in bulk with matching results
+        """
+        value = [1, 2, 65535, 0]
+        for item in (U16, I32, Annotated[int, IntField(8, 'little', False)]):
+            with self.subTest(item=item):
+                hinted   = HintedList(U8, item)
+                packed   = hinted._pack(value, self.ctx)
+                field    = deanno(item)[1]
+                expected = b'\x04' + \
+                    b''.join(field._pack(v, self.ctx) for v in value)
+                self.assertIsNotNone(hinted.array)
+                self.assertEqual(packed, expected)
+                self.assertEqual(hinted._unpack(packed, self.ctx), value)
+        static = StaticList(4, U16, container='array')
+        packed = static._pack(value, self.ctx)
+        self.assertEqual(static._unpack(packed, self.ctx), array('H', value))
+        self.assertEqual(GreedyList(U16)._unpack(packed, self.ctx), value)
+        self.assertRaises(OverflowError, static._pack, [65536], self.ctx)
+        self.assertRaises(ValueError, static._unpack, packed[:-1], self.ctx)
+        self.assertRaises(ValueError, GreedyList(U16)._unpack, b'\0', self.ctx)
+        self.assertRaises(TypeError, StaticList, 1, U48, container='array')
+
+    @unittest.skipUnless(find_spec('numpy'), 'numpy is not installed')
+    def test_list_numpy(self):
+        """
+        ensure integer lists unpack into numpy arrays when requested
+        """
+        value    = [1, 2, 65535, 0]
+        hinted   = HintedList(U8, U16, container='numpy')
+        packed   = HintedList(U8, U16)._pack(value, self.ctx)
+        unpacked = hinted._unpack(packed, self.ctx)
+        self.assertEqual(unpacked.tolist(), value)
+        self.assertEqual(hinted._pack(unpacked, self.ctx), packed)
@@ -0,0 +1,285 @@
+"""
+PyStructs Stream Decoder UnitTests
+"""
+import asyncio
+import tempfile
+import unittest
+from io import BytesIO
+from typing import List
+
+from typing_extensions import Annotated
+
+from .. import *
+
+#** Variables **#
+__all__ = ['StreamTests']
+
+#** Classes **#
+
+class Frame(Struct):
+    kind:    U8
+    payload: Annotated[bytes, HintedBytes(U32)]
+
+class Fixed(Struct):
+    a: U16
+    b: U32
+
+class Named(Struct):
+    name: Domain
+    ttl:  U16
+
+class Points(Struct):
+    items: Annotated[List[Fixed], HintedList(U16, Fixed)]
+
+class CountingReader(asyncio.StreamReader):
+    """stream reader tracking number of reads"""
+
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.reads = 0
+        self.feed_data(data)
+        self.feed_eof()
+
+    async def readexactly(self, n):
+        self.reads += 1
+        return await super().readexactly(n)
+
+class BufferWriter:
+    """minimal stream writer collecting written bytes"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+class ShortWriter:
+    """raw file writing a few bytes per call and replaying given returns"""
+
+    def __init__(self, *returns):
+        self.data    = bytearray()
+        self.returns = list(returns)
+        self.closed  = False
+
+    def write(self, data: memoryview):
+        if self.returns and self.returns[0] is not True:
+            return self.returns.pop(0)
+        if self.returns:
+            self.returns.pop(0)
+        self.data += data[:3]
+        return min(3, len(data))
+
+    def close(self):
+        self.closed = True
+
+class StreamTests(unittest.TestCase):
+    """Incremental Stream Decoder UnitTests"""
+
+    def test_byte_by_byte(self):
+        """
+        ensure records are emitted as soon as they complete
+        """
+        frames  = [Frame(1, b'hello'), Frame(2, b''), Frame(3, b'x' * 300)]
+        raw     = b''.join(f.pack() for f in frames)
+        decoder = StreamDecoder(Frame)
+        records = []
+        for n in range(len(raw)):
+            records.extend(decoder.feed(raw[n:n+1]))
+        self.assertEqual(records, frames)
+        self.assertEqual(decoder.pending(), 0)
+
+    def test_waits_for_frame(self):
+        """
+        ensure a large frame is not re-parsed until fully buffered
+        """
+        frame   = Frame(7, b'y' * 1000)
+        raw     = frame.pack()
+        decoder = StreamDecoder(Frame)
+        self.assertEqual(decoder.feed(raw[:10]), [])
+        self.assertEqual(decoder.needed, len(raw))
+        self.assertEqual(decoder.feed(raw[10:500]), [])
+        self.assertEqual(decoder.feed(raw[500:] + raw[:3]), [frame])
+        self.assertEqual(decoder.pending(), 3)
+
+    def test_item_list(self):
+        """
+        ensure a list of fixed-size struct items is decoded only once ready
+        """
+        class Counting(StreamDecoder):
+            attempts = 0
+            def _decode(self):
+                Counting.attempts += 1
+                return super()._decode()
+        points  = Points([Fixed(n, n) for n in range(1000)])
+        raw     = points.pack()
+        decoder = Counting(Points)
+        records = []
+        for n in range(0, len(raw), 64):
+            records.extend(decoder.feed(raw[n:n+64]))
+        self.assertEqual(records, [points])
+        self.assertEqual(Counting.attempts, 2)
+
+    def test_fixed_and_domain(self):
+        """
+        ensure fixed and domain structs decode across chunk boundaries
+        """
+        fixed   = [Fixed(n, n * 1000) for n in range(10)]
+        raw     = b''.join(f.pack() for f in fixed)
+        decoder = StreamDecoder(Fixed)
+        records = decoder.feed(raw[:13]) + decoder.feed(raw[13:])
+        self.assertEqual(records, fixed)
+        named   = Named(b'www.example.com', 60)
+        raw     = named.pack()
+        decoder = StreamDecoder(Named)
+        records = []
+        for n in range(0, len(raw), 3):
+            records.extend(decoder.feed(raw[n:n+3]))
+        self.assertEqual(records, [named])
+
+    def test_malformed(self):
+        """
+        ensure malformed input raises instead of waiting for more data
+        """
+        class Magic(Struct):
+            magic: Annotated[bytes, Const(b'MG')]
+            value: U8
+        decoder = StreamDecoder(Magic)
+        self.assertEqual(decoder.feed(b'M'), [])
+        with self.assertRaises(ValueError) as err:
+            decoder.feed(b'X\x01')
+        self.assertNotIsInstance(err.exception, IncompleteError)
+        decoder.reset()
+        self.assertEqual(decoder.feed(b'MG\x01'), [Magic(b'MG', 1)])
+
+    def test_malformed_after_records(self):
+        """
+        ensure records decoded before malformed data are returned first
+        """
+        class Magic(Struct):
+            magic: Annotated[bytes, Const(b'MG')]
+            value: U8
+        class Tagged(Struct):
+            magic: Annotated[bytes, Const(b'MG')]
+            data:  Annotated[bytes, HintedBytes(U8)]
+        for struct, good, pending in (
+            (Magic,  Magic(b'MG', 1), 0),
+            (Tagged, Tagged(b'MG', b'abc'), 3),
+        ):
+            with self.subTest(struct=struct.__name__):
+                raw     = good.pack()
+                decoder = StreamDecoder(struct)
+                records = decoder.feed(raw + raw + b'Z\x00\x00')
+                self.assertEqual(records, [good, good])
+                self.assertRaises(ValueError, decoder.feed, b'')
+                self.assertEqual(decoder.pending(), pending)
+        decoder = StreamDecoder(Magic)
+        self.assertRaises(ValueError, decoder.feed, b'ZZ\x00MG\x02')
+        self.assertEqual(decoder.feed(b''), [Magic(b'MG', 2)])
+
+    def test_aread_awrite(self):
+        """
+        ensure async read/write round-trips with minimal reads
+        """
+        async def run():
+            frames = [Frame(1, b'hello'), Frame(2, b'')]
+            fixed  = Fixed(1, 2)
+            writer = BufferWriter()
+            for frame in frames:
+                await frame.awrite(writer)
+            await fixed.awrite(writer)
+            reader  = CountingReader(bytes(writer.data))
+            records = [await Frame.aread(reader) for _ in frames]
+            self.assertEqual(records, frames)
+            self.assertEqual(reader.reads, 3)
+            self.assertEqual(await Fixed.aread(reader), fixed)
+            self.assertEqual(reader.reads, 4)
+            with self.assertRaises(asyncio.IncompleteReadError):
+                await Fixed.aread(reader)
+            points = Points([Fixed(n, n) for n in range(1000)])
+            reader = CountingReader(points.pack())
+            self.assertEqual(await Points.aread(reader), points)
+            self.assertEqual(reader.reads, 2)
+        asyncio.run(run())
+
+    def test_reader_writer(self):
+        """
+        ensure record files round-trip with mmap and buffered reads
+        """
+        for struct, records in (
+            (Fixed, [Fixed(n, n * 7) for n in range(1000)]),
+            (Frame, [Frame(n % 256, b'z' * (n % 50)) for n in range(1000)]),
+        ):
+            with tempfile.TemporaryFile() as f:
+                with StructWriter(f, bufsize=4096) as writer:
+                    writer.write_many(records)
+                for use_mmap in (True, False):
+                    f.seek(0)
+                    reader = StructReader(f, struct, 1000, use_mmap)
+                    self.assertEqual(list(reader), records)
+                    self.assertEqual(f.tell(), f.seek(0, 2))
+            stream = BytesIO()
+            with StructWriter(stream) as writer:
+                writer.write_many(records)
+            packed = b''.join(record.pack() for record in records)
+            self.assertEqual(stream.getvalue(), packed)
+            stream.seek(0)
+            self.assertEqual(list(StructReader(stream, struct, 333)), records)
+
+    def test_writer_partial(self):
+        """
+        ensure short, blocked, and stalled writes never drop buffered data
+        """
+        records = [Fixed(n, n * 7) for n in range(10)]
+        packed  = b''.join(record.pack() for record in records)
+        raw     = ShortWriter(True, None, True, 0)
+        writer  = StructWriter(raw)
+        writer.write_many(records)
+        self.assertRaises(BlockingIOError, writer.flush)
+        self.assertEqual(bytes(raw.data + writer.buffer), packed)
+        self.assertRaises(OSError, writer.flush)
+        self.assertEqual(bytes(raw.data + writer.buffer), packed)
+        writer.close()
+        self.assertEqual(bytes(raw.data), packed)
+        self.assertFalse(writer.buffer)
+        self.assertTrue(raw.closed)
+
+    def test_reader_truncated(self):
+        """
+        ensure truncated trailing records raise incomplete errors
+        """
+        raw = Frame(1, b'hello').pack() + Frame(2, b'world').pack()[:-1]
+        with tempfile.TemporaryFile() as f:
+            f.write(raw)
+            for use_mmap in (True, False):
+                f.seek(0)
+                records = []
+                with self.assertRaises(IncompleteError):
+                    for record in StructReader(f, Frame, use_mmap=use_mmap):
+                        records.append(record)
+                self.assertEqual(records, [Frame(1, b'hello')])
+
+    def test_unpack_parallel(self):
+        """
+        ensure records decode in order across worker processes
+        """
+        fixed  = [Fixed(n % 65536, n) for n in range(5000)]
+        frames = [Frame(n % 256, b'z' * (n % 20)) for n in range(2000)]
+        for struct, records in ((Fixed, fixed), (Frame, frames)):
+            raw = b''.join(record.pack() for record in records)
+            with tempfile.NamedTemporaryFile() as f:
+                f.write(raw)
+                f.flush()
+                for workers in (1, 2):
+                    result = struct.unpack_file(f.name, workers)
+                    self.assertEqual(list(result), records)
+            result = struct.unpack_parallel(raw, workers=2)
+            self.assertEqual(list(result), records)
+        raw     = b''.join(record.pack() for record in fixed)
+        columns = Fixed.unpack_parallel(raw, workers=2, columns='array')
+        self.assertEqual(list(columns['b']), [r.b for r in fixed])
+        self.assertRaises(ValueError, Fixed.unpack_parallel, raw[:-1], 2)
+        self.assertRaises(ValueError,
+            Fixed.unpack_parallel, raw, 2, columns='list')
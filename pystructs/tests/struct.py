@@ -3,11 +3,16 @@ PyStructs Struct Object UnitTests
 """
 import struct
 import unittest
+from array import array
+from importlib.util import find_spec
+from ipaddress import IPv4Address
+from typing import List, Union
 from typing_extensions import Annotated
 
 from pyderive import astuple
 
 from .. import *
+from ..codec import FixedRun, get_codec
 
 #** Variables **#
 __all__ = ['StructTests']
@@ -68,3 +73,453 @@ class StructTests(unittest.TestCase):
         repacked = unpacked.pack()
         self.assertEqual(foo, unpacked)
         self.assertEqual(packed, repacked)
+
+    def test_fixed_runs(self):
+        """
+        ensure fixed-width field runs are merged and remain byte-identical
+        """
+        class Foo(Struct):
+            a: U8
+            b: U16
+            c: Annotated[int, IntField(2, 'little', False)]
+            d: I64
+            e: bytes = field(field=StaticBytes(4))
+            f: Domain = b'example.com'
+        steps = [s for s in Foo.__steps__ if isinstance(s, FixedRun)]
+        self.assertEqual([s.codec.format for s in steps], ['>BH', '<H', '>q4s'])
+        foo      = Foo(1, 2, 3, -4, b'ab')
+        packed   = foo.pack()
+        unpacked = Foo.unpack(packed)
+        expected = struct.pack('>BH', 1, 2) + struct.pack('<H', 3) + \
+            struct.pack('>q4s', -4, b'ab') + b'\x07example\x03com\x00'
+        self.assertEqual(packed, expected)
+        self.assertEqual(foo, unpacked)
+        with self.assertRaisesRegex(OverflowError, r'^Foo\.a->'):
+            Foo(256, 2, 3, 4, b'').pack()
+        with self.assertRaisesRegex(OverflowError, r'^Foo\.e->'):
+            Foo(1, 2, 3, 4, b'abcde').pack()
+        with self.assertRaisesRegex(ValueError, r'^Foo\.d->too little data'):
+            Foo.unpack(packed[:6])
+
+    def test_codegen(self):
+        """
+        ensure code-generated struct pack/unpack matches the generic version
+        """
+        class Bar(Struct, codegen=True):
+            z: U32
+        class Foo(Struct, codegen=True):
+            a: U8
+            b: Annotated[int, IntField(2, 'little', False)]
+            c: bytes = field(field=StaticBytes(4))
+            d: Bar = field(default_factory=lambda: Bar(0))
+            e: Domain = b'example.com'
+            f: U16 = 0
+        class Baz(Foo, codegen=False):
+            pass
+        foo      = Foo(1, 2, b'ab', Bar(3), f=4)
+        packed   = foo.pack()
+        unpacked = Foo.unpack(packed)
+        self.assertEqual(foo, unpacked)
+        self.assertEqual(packed, Baz(*astuple(foo)[:3], Bar(3), f=4).pack())
+        self.assertEqual(Baz.unpack(packed).d, Bar(3))
+        with self.assertRaisesRegex(OverflowError, r'^Foo\.d->Bar\.z->'):
+            Foo(1, 2, b'', Bar(-1)).pack()
+        with self.assertRaisesRegex(ValueError, r'^Foo\.c->too little data'):
+            Foo.unpack(packed[:5])
+
+    def test_trusted(self):
+        """
+        ensure trusted structs match checked ones and still annotate errors
+        """
+        class Bar(Struct, trusted=True):
+            z: U32
+        class Foo(Struct, trusted=True):
+            a: U8
+            b: bytes = field(field=StaticBytes(4))
+            c: Bar = field(default_factory=lambda: Bar(0))
+            d: Annotated[bytes, HintedBytes(U16)] = b''
+            e: U16 = 0
+        class Baz(Foo, trusted=False):
+            pass
+        foo    = Foo(1, b'ab', Bar(3), b'hinted', 4)
+        packed = foo.pack()
+        self.assertIs(Baz._unpack.__func__, Struct._unpack.__func__)
+        self.assertEqual(Foo.unpack(packed), foo)
+        self.assertEqual(Baz.unpack(packed).c, Bar(3))
+        self.assertIsInstance(
+            Foo.unpack(packed, zero_copy=True).b, memoryview)
+        with self.assertRaisesRegex(OverflowError, r'^Foo\.c->Bar\.z->'):
+            Foo(1, b'', Bar(-1)).pack()
+        with self.assertRaisesRegex(ValueError, r'^Foo\.d->too little data'):
+            Foo.unpack(packed[:10])
+        ctx1, ctx2 = Context(), Context()
+        for cls, ctx in ((Foo, ctx1), (Baz, ctx2)):
+            with self.assertRaises(ValueError):
+                cls.unpack(packed[:10], ctx)
+        self.assertEqual(ctx1.index, ctx2.index)
+        # fixed-run fallback must not re-run earlier domain compression
+        class Named(Struct, trusted=True):
+            name: Domain
+            addr: IPv4
+        class Checked(Struct):
+            name: Domain
+            addr: IPv4
+        named  = Named(b'example.com', '1.2.3.4')
+        packed = named.pack()
+        self.assertEqual(packed, Checked(b'example.com', '1.2.3.4').pack())
+        self.assertEqual(len(packed), 17)
+        self.assertEqual(Named.unpack(packed),
+            Named(b'example.com', IPv4Address('1.2.3.4')))
+
+    def test_switch(self):
+        """
+        ensure switch field dispatches variants on tag and value class
+        """
+        class Foo(Struct):
+            a: U16
+        class Bar(Struct):
+            b: Annotated[bytes, HintedBytes(U8)]
+        class Baz(Bar):
+            pass
+        message = Switch(U8, {1: Foo, 2: Bar})
+        class Frame(Struct):
+            seq: U8
+            msg: Annotated[Union[Foo, Bar], message]
+        class Frames(Struct):
+            msgs: Annotated[List[Union[Foo, Bar]], HintedList(U8, message)]
+        frame  = Frame(1, Bar(b'hi'))
+        packed = frame.pack()
+        self.assertEqual(packed, b'\x01\x02\x02hi')
+        self.assertEqual(Frame.unpack(packed), frame)
+        self.assertEqual(frame.packed_size(), len(packed))
+        self.assertEqual(Frame(1, Baz(b'hi')).pack(), packed)
+        frames = Frames([Foo(1), Bar(b'x')])
+        self.assertEqual(Frames.unpack(frames.pack()), frames)
+        self.assertEqual(list(Frame.unpack_many(packed * 2)), [frame] * 2)
+        wide = Switch(U16, {300: Foo})
+        self.assertIsNone(wide.table)
+        self.assertEqual(wide._unpack(b'\x01\x2c\x00\x05', Context()), Foo(5))
+        with self.assertRaisesRegex(ValueError, r'^Frame\.msg->unknown'):
+            Frame.unpack(b'\x01\x09')
+        with self.assertRaisesRegex(ValueError, r'^Frame\.msg->no switch'):
+            Frame(1, 5).pack()
+
+    def test_hinted_struct(self):
+        """
+        ensure hinted struct parses within a window of the parent buffer
+        """
+        class Inner(Struct):
+            kind: U8
+            name: Domain
+            rest: Annotated[List[int], GreedyList(U8)]
+        class Outer(Struct):
+            name:  Domain
+            inner: Annotated[Inner, HintedStruct(U16, Inner)]
+            tail:  U8
+        outer  = Outer(b'example.com', Inner(1, b'www.example.com', [1, 2]), 9)
+        packed = outer.pack()
+        self.assertEqual(packed[13:15], b'\x00\x09')
+        self.assertEqual(packed[20:22], b'\xc0\x00')
+        self.assertEqual(outer.packed_size(), len(packed))
+        self.assertEqual(Outer.unpack(packed), outer)
+        buffer = bytearray(len(packed))
+        self.assertEqual(outer.pack_into(buffer), len(packed))
+        self.assertEqual(buffer, packed)
+        self.assertEqual(list(Outer.unpack_many(packed * 2)), [outer] * 2)
+        padded = packed[:14] + b'\x0b' + packed[15:-1] + b'\x00\x00\x09'
+        self.assertEqual(Outer.unpack(padded).inner.rest, [1, 2, 0, 0])
+        with self.assertRaisesRegex(ValueError, r'^Outer\.inner->'):
+            Outer.unpack(packed[:-3])
+        broken = packed[:14] + b'\x02' + packed[15:]
+        with self.assertRaisesRegex(ValueError, r'window\(2\)'):
+            StreamDecoder(Outer).feed(broken)
+        # wrappers apply to values when sizing as well as packing
+        def wrap(n: int) -> Inner:
+            return Inner(n, b'a.b', [n])
+        wrapped = HintedStruct(U16, Annotated[wrap, Inner])
+        data    = wrapped._pack(5, Context())
+        self.assertEqual(wrapped._packed_size(5, Context()), len(data))
+
+    def test_pack_many(self):
+        """
+        ensure batches of records pack into one buffer with an offset index
+        """
+        class Fixed(Struct):
+            a: U8
+            b: U32
+        class Named(Struct):
+            name: Domain
+            a:    U16
+        fixed = [Fixed(n, n * 1000) for n in range(16)]
+        index: List[int] = []
+        packed = Fixed.pack_many(fixed, index=index)
+        self.assertEqual(packed, b''.join(f.pack() for f in fixed))
+        self.assertEqual(index, list(range(0, 80, 5)))
+        self.assertEqual(Fixed.unpack_many(packed), fixed)
+        with self.assertRaisesRegex(OverflowError, r'^Fixed\.a->'):
+            Fixed.pack_many([Fixed(0, 0), Fixed(256, 0)])
+        named = [Named(b'a.example.com', 1), Named(b'b.example.com', 2)]
+        index  = []
+        packed = Named.pack_many(named, index=index)
+        self.assertEqual(index, [0, 17])
+        self.assertEqual(packed[17:], b'\x01b\xc0\x02\x00\x02')
+        self.assertEqual(Named.unpack_many(packed), named)
+        index  = []
+        packed = pack_sequence([fixed[1], named[0], fixed[2]], index=index)
+        self.assertEqual(index, [0, 5, 22])
+        self.assertEqual(packed,
+            fixed[1].pack() + named[0].pack() + fixed[2].pack())
+
+    def test_zero_copy(self):
+        """
+        ensure struct unpacks from buffer objects with optional zero-copy
+        """
+        class Foo(Struct):
+            a: U8
+            b: bytes = field(field=StaticBytes(4))
+            c: Annotated[bytes, HintedBytes(U16)] = b''
+        foo    = Foo(1, b'ab', b'hinted')
+        packed = foo.pack()
+        for buffer in (bytearray(packed), memoryview(packed)):
+            self.assertEqual(Foo.unpack(buffer), foo)
+        view = Foo.unpack(packed, zero_copy=True)
+        self.assertIsInstance(view.b, memoryview)
+        self.assertIsInstance(view.c, memoryview)
+        self.assertEqual(view, foo)
+        self.assertEqual(view.pack(), packed)
+        # zero-copy only applies to the call and never leaks into the ctx
+        ctx = Context()
+        for unpack_zero in (
+            lambda: Foo.unpack(packed, ctx, zero_copy=True).c,
+            lambda: Foo.unpack_many(packed, 1, ctx, zero_copy=True)[0].c,
+            lambda: Foo.view(packed, ctx, zero_copy=True).c,
+        ):
+            ctx.reset()
+            self.assertIsInstance(unpack_zero(), memoryview)
+            self.assertFalse(ctx.zero_copy)
+            ctx.reset()
+            self.assertIsInstance(Foo.unpack(packed, ctx).c, bytes)
+
+    def test_pack_into(self):
+        """
+        ensure struct packs directly into preallocated buffers
+        """
+        class Bar(Struct):
+            z: U32
+            y: Annotated[bytes, HintedBytes(U8)] = b'bar'
+        class Foo(Struct):
+            a: U8
+            b: bytes = field(field=StaticBytes(4))
+            c: Bar = field(default_factory=lambda: Bar(1))
+            d: Domain = b'example.com'
+        foo    = Foo(1, b'ab')
+        packed = foo.pack()
+        buffer = bytearray(len(packed) + 4)
+        self.assertEqual(foo.pack_into(buffer, 4), len(packed))
+        self.assertEqual(bytes(buffer[4:]), packed)
+        buffer = bytearray(8)
+        size   = pack_into((U8, U16, StaticBytes(4)), buffer, 1, 1, 2, b'a')
+        self.assertEqual(size, 7)
+        self.assertEqual(bytes(buffer), b'\x00\x01\x00\x02a\x00\x00\x00')
+        with self.assertRaisesRegex(OverflowError, r'^Foo\.c->Bar\.y->buffer'):
+            foo.pack_into(bytearray(12))
+        self.assertRaises(TypeError, foo.pack_into, bytes(len(packed)))
+
+    def test_sizes(self):
+        """
+        ensure static and packed sizes match the packed encodings
+        """
+        class Bar(Struct):
+            z: U32
+            y: List[int] = field(field=StaticList(2, U16))
+        class Foo(Struct):
+            a: U8
+            b: Bar
+            c: IPv4 = IPv4Address('127.0.0.1')
+        class Baz(Struct):
+            a: Annotated[bytes, HintedBytes(U16)]
+            b: Annotated[List[Bar], HintedList(U8, Bar)]
+            c: Domain = b'example.com'
+            d: Domain = b'www.example.com'
+        foo = Foo(1, Bar(2, [3, 4]))
+        baz = Baz(b'hinted', [Bar(1, [2, 3])] * 3)
+        self.assertEqual(Bar.calcsize(), 8)
+        self.assertEqual(Foo.calcsize(), len(foo.pack()))
+        self.assertEqual(foo.packed_size(), len(foo.pack()))
+        self.assertEqual(baz.packed_size(), len(baz.pack()))
+        self.assertIsNone(Baz.__size__)
+        self.assertRaises(TypeError, Baz.calcsize)
+
+    def test_unpack_many(self):
+        """
+        ensure back-to-back records unpack in bulk and as columns
+        """
+        class Foo(Struct):
+            a: U8
+            b: I32
+            c: bytes = field(field=StaticBytes(4))
+        class Bar(Struct):
+            a: U8
+            b: Annotated[bytes, HintedBytes(U8)]
+        foos = [Foo(n, -n, b'x' * (n % 4)) for n in range(10)]
+        bars = [Bar(n, b'y' * n) for n in range(10)]
+        raw  = b''.join(foo.pack() for foo in foos)
+        self.assertEqual(Foo.unpack_many(raw), foos)
+        self.assertEqual(Foo.unpack_many(raw, 3), foos[:3])
+        raw2 = b''.join(bar.pack() for bar in bars)
+        self.assertEqual(Bar.unpack_many(raw2), bars)
+        self.assertRaises(ValueError, Foo.unpack_many, raw[:-1])
+        columns = Foo.unpack_columns(raw)
+        self.assertEqual(columns['a'], array('B', range(10)))
+        self.assertEqual(list(columns['b']), [-n for n in range(10)])
+        self.assertEqual(columns['c'], [foo.c for foo in foos])
+        self.assertRaises(ValueError, Foo.unpack_columns, raw[:-1])
+        self.assertRaises(TypeError, Bar.unpack_columns, raw)
+        self.assertRaises(ValueError, Foo.unpack_columns, raw, None, 'list')
+
+    def test_unpack_columns_float(self):
+        """
+        ensure float fields unpack into native float columns
+        """
+        class Foo(Struct):
+            a: F16
+            b: F32
+            c: F64
+        raw     = b''.join(Foo(n / 2, n / 4, n / 8).pack() for n in range(10))
+        columns = Foo.unpack_columns(raw)
+        self.assertEqual(columns['a'], [n / 2 for n in range(10)])
+        self.assertEqual(columns['b'], array('f', [n / 4 for n in range(10)]))
+        self.assertEqual(columns['c'], array('d', [n / 8 for n in range(10)]))
+
+    @unittest.skipUnless(find_spec('numpy'), 'numpy is not installed')
+    def test_unpack_columns_numpy(self):
+        """
+        ensure flat fixed-width records unpack into numpy columns
+        """
+        class Foo(Struct):
+            a: U8
+            b: Annotated[int, IntField(2, 'little', False)]
+        raw     = b''.join(Foo(n, n * 256).pack() for n in range(10))
+        columns = Foo.unpack_columns(raw, container='numpy')
+        self.assertEqual(columns['a'].tolist(), list(range(10)))
+        self.assertEqual(columns['b'].tolist(), [n * 256 for n in range(10)])
+        class Bar(Struct):
+            a: F16
+            b: F32
+            c: F64
+        raw     = b''.join(Bar(n / 2, n / 4, n / 8).pack() for n in range(10))
+        columns = Bar.unpack_columns(raw, container='numpy')
+        self.assertEqual(columns['a'].dtype.str, '>f2')
+        self.assertEqual(columns['a'].tolist(), [n / 2 for n in range(10)])
+        self.assertEqual(columns['b'].tolist(), [n / 4 for n in range(10)])
+        self.assertEqual(columns['c'].tolist(), [n / 8 for n in range(10)])
+
+    def test_codec(self):
+        """
+        ensure compiled codecs and the cached functional api agree
+        """
+        fields = (U8, Annotated[bytes, HintedBytes(U16)], IPv4, Domain)
+        values = (1, b'abc', IPv4Address('1.2.3.4'), b'example.com')
+        codec  = Codec(fields)
+        packed = codec.pack(*values)
+        self.assertEqual(packed, pack(fields, *values))
+        self.assertEqual(codec.unpack(packed), values)
+        self.assertEqual(unpack(list(fields), packed), values)
+        self.assertIs(get_codec(fields), get_codec(list(fields)))
+        # mutated field definitions are recompiled rather than reused
+        size = IntField(1)
+        self.assertEqual(pack([size], 1), b'\x01')
+        size.size = 2
+        self.assertEqual(pack([size], 1), b'\x00\x01')
+        self.assertEqual(unpack([size], b'\x00\x01'), (1, ))
+        self.assertEqual(Codec((U8, U32)).size, 5)
+        self.assertIsNone(codec.size)
+        self.assertRaisesRegex(OverflowError, r'^4 fields vs 1 values\.$',
+            codec.pack, 1)
+        self.assertRaisesRegex(ValueError, r'^field\(1\)->HintedBytes->',
+            codec.unpack, b'\x01\x00')
+
+    def test_profiler(self):
+        """
+        ensure profiler records per-struct and per-field statistics
+        """
+        class Bar(Struct):
+            z: U32
+            y: Annotated[bytes, HintedBytes(U8)]
+        class Foo(Struct):
+            a: U8
+            b: U16
+            c: Bar
+        profiler = Profiler()
+        foo      = Foo(1, 2, Bar(3, b'abc'))
+        packed   = profiler.pack(foo)
+        self.assertEqual(packed, foo.pack())
+        self.assertEqual(profiler.unpack(Foo, packed), foo)
+        self.assertEqual(profiler.unpack(Foo, packed), foo)
+        stats = profiler.to_dict()
+        self.assertEqual(stats['pack']['Foo']['bytes'], len(packed))
+        self.assertEqual(stats['unpack']['Foo']['calls'], 2)
+        self.assertEqual(stats['unpack']['Foo.c']['bytes'], 16)
+        self.assertEqual(stats['unpack']['Bar.y']['bytes'], 8)
+        self.assertGreater(stats['unpack']['Foo']['ns'], 0)
+        self.assertEqual(profiler.to_pstats().total_calls, 21)
+        with self.assertRaisesRegex(ValueError, r'^Foo\.c->Bar\.z->'):
+            profiler.unpack(Foo, packed[:5])
+
+    def test_view(self):
+        """
+        ensure struct views decode only the fields that are accessed
+        """
+        class Bar(Struct):
+            z: U32
+            y: Annotated[bytes, HintedBytes(U8)]
+        class Foo(Struct):
+            kind:  U16
+            body:  Annotated[bytes, HintedBytes(U16)]
+            items: Annotated[List[int], HintedList(U8, U16)]
+            bar:   Bar
+            name:  Domain
+            tail:  U8
+        foo    = Foo(7, b'x' * 4096, [1, 2, 3], Bar(4, b'abc'), b'a.com', 9)
+        packed = foo.pack()
+        view   = Foo.view(packed)
+        self.assertEqual(view.kind, 7)
+        self.assertEqual(view._values, {0: 7})
+        self.assertEqual(view.tail, 9)
+        self.assertNotIn(1, view._values)
+        self.assertEqual(view.bar, Bar(4, b'abc'))
+        self.assertEqual(view.nbytes, len(packed))
+        self.assertEqual(view.unpack(), foo)
+        self.assertRaises(AttributeError, getattr, view, 'missing')
+        # offsets are relative to the context index
+        view = Foo.view(b'\x00\x00' + packed, Context(index=2))
+        self.assertEqual(view.items, [1, 2, 3])
+        with self.assertRaisesRegex(ValueError, r'^Foo\.body->'):
+            Foo.view(packed[:100]).tail
+
+    def test_view_assign(self):
+        """
+        ensure writable views patch fixed-width fields in place
+        """
+        class Header(Struct):
+            seq:  U32
+            name: Annotated[bytes, HintedBytes(U8)]
+            ttl:  U8
+            tag:  Annotated[bytes, StaticBytes(4)]
+        header = Header(1, b'example', 64, b'ab')
+        buffer = bytearray(header.pack())
+        view   = Header.view(buffer)
+        self.assertEqual(view.ttl, 64)
+        view.seq = 2
+        view.ttl = 63
+        view.tag = b'xyz'
+        self.assertEqual(view.ttl, 63)
+        patched = Header(2, b'example', 63, b'xyz')
+        self.assertEqual(bytes(buffer), patched.pack())
+        self.assertEqual(Header.unpack(buffer).seq, 2)
+        self.assertRaises(TypeError, setattr, view, 'name', b'other')
+        self.assertRaises(AttributeError, setattr, view, 'missing', 1)
+        with self.assertRaisesRegex(OverflowError, r'^Header\.ttl->'):
+            view.ttl = 256
+        readonly = Header.view(bytes(buffer))
+        self.assertRaises(TypeError, setattr, readonly, 'seq', 3)